@@ -1,6 +1,6 @@
 from ipcore_lib.runtime.register import AccessType
 
-from .bus import CocotbBus
+from .bus import BurstingBus, CocotbBus
 from .loader import IpCoreDriver, load_driver
 
-__all__ = ["AccessType", "CocotbBus", "load_driver", "IpCoreDriver"]
+__all__ = ["AccessType", "BurstingBus", "CocotbBus", "load_driver", "IpCoreDriver"]
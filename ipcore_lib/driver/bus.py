@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Tuple
 
 from ipcore_lib.runtime.register import AbstractBusInterface
 
@@ -6,9 +6,46 @@ from ipcore_lib.runtime.register import AbstractBusInterface
 # This module only provides concrete implementations
 
 
+def _make_axil_master(dut: Any, bus_name: str, clock: Any, reset: Any) -> Any:
+    # delayed import to avoiding forcing cocotb dependency on standard users
+    from cocotbext.axi import AxiLiteBus, AxiLiteMaster
+
+    bus = AxiLiteBus.from_prefix(dut, bus_name)
+    return AxiLiteMaster(bus, clock, reset)
+
+
+def _make_avmm_master(dut: Any, bus_name: str, clock: Any, reset: Any) -> Any:
+    from cocotb_bus.drivers.avalon import AvalonMaster
+
+    # AvalonMaster(entity, name, clock, ...)
+    return AvalonMaster(dut, bus_name, clock)
+
+
+# bus_type -> (driver factory, read handler, write handler, bulk read handler,
+# bulk write handler), handlers given by method name
+_BUS_BACKENDS = {
+    "axil": (
+        _make_axil_master,
+        "_read_axil",
+        "_write_axil",
+        "_read_words_axil",
+        "_write_words_axil",
+    ),
+    "avmm": (
+        _make_avmm_master,
+        "_read_avmm",
+        "_write_avmm",
+        "_read_words_scalar",
+        "_write_words_scalar",
+    ),
+}
+
+
 class CocotbBus(AbstractBusInterface):
     """Bus interface implementation for Cocotb simulations using AXI-Lite or Avalon-MM."""
 
+    __slots__ = ("bus_type", "_driver", "_read", "_write", "_read_words", "_write_words")
+
     def __init__(
         self, dut: Any, bus_name: str, clock: Any, reset: Any = None, bus_type: str = "axil"
     ):
@@ -24,38 +61,147 @@ class CocotbBus(AbstractBusInterface):
             if reset is None:
                 raise AttributeError(f"No reset signal found. Please provide reset explicitly.")
 
-        if bus_type == "axil":
-            # delayed import to avoiding forcing cocotb dependency on standard users
-            from cocotbext.axi import AxiLiteBus, AxiLiteMaster
+        backend = _BUS_BACKENDS.get(bus_type)
+        if backend is None:
+            raise ValueError(f"Unsupported bus_type: {bus_type}")
+        make_driver, read_name, write_name, read_words_name, write_words_name = backend
+
+        self._driver = make_driver(dut, bus_name, clock, reset)
+        self._read = getattr(self, read_name)
+        self._write = getattr(self, write_name)
+        self._read_words = getattr(self, read_words_name)
+        self._write_words = getattr(self, write_words_name)
+
+    async def read_word(self, address: int) -> int:
+        # Transaction handlers are bound once in __init__ so the per-word path
+        # does not re-dispatch on bus_type
+        return await self._read(address)
+
+    async def write_word(self, address: int, data: int) -> None:
+        await self._write(address, data)
+
+    async def _read_axil(self, address: int) -> int:
+        val = await self._driver.read(address, 4)
+        # val is ReadResult, val.data is bytes
+        return int.from_bytes(val.data, byteorder="little")
+
+    async def _write_axil(self, address: int, data: int) -> None:
+        await self._driver.write(address, data.to_bytes(4, byteorder="little"))
+
+    async def _read_avmm(self, address: int) -> int:
+        # AvalonMaster.read(address, sync=True) -> returns data (LogicArray/int)
+        val = await self._driver.read(address)
+        # Ensure proper integer conversion
+        return int(val)
+
+    async def _write_avmm(self, address: int, data: int) -> None:
+        # AvalonMaster.write(address, value)
+        await self._driver.write(address, data)
+
+    async def read_words(self, address: int, count: int) -> List[int]:
+        if count == 0:
+            return []
+        return await self._read_words(address, count)
 
-            bus = AxiLiteBus.from_prefix(dut, bus_name)
-            self._driver = AxiLiteMaster(bus, clock, reset)
+    async def write_words(self, address: int, values: List[int]) -> None:
+        if values:
+            await self._write_words(address, values)
 
-        elif bus_type == "avmm":
-            from cocotb_bus.drivers.avalon import AvalonMaster
+    async def _read_words_axil(self, address: int, count: int) -> List[int]:
+        # AxiLiteMaster pipelines a multi-word read as back-to-back transactions
+        val = await self._driver.read(address, 4 * count)
+        data = val.data
+        return [int.from_bytes(data[i : i + 4], byteorder="little") for i in range(0, len(data), 4)]
 
-            # AvalonMaster(entity, name, clock, ...)
-            self._driver = AvalonMaster(dut, bus_name, clock)
+    async def _write_words_axil(self, address: int, values: List[int]) -> None:
+        data = b"".join(v.to_bytes(4, byteorder="little") for v in values)
+        await self._driver.write(address, data)
 
+    async def _read_words_scalar(self, address: int, count: int) -> List[int]:
+        # No native burst: one awaited transaction per word
+        return [await self._read(address + 4 * i) for i in range(count)]
+
+    async def _write_words_scalar(self, address: int, values: List[int]) -> None:
+        for i, value in enumerate(values):
+            await self._write(address + 4 * i, value)
+
+
+class BurstingBus(AbstractBusInterface):
+    """
+    Write-combining wrapper that turns runs of single-word writes into bursts.
+
+    Writes are queued and forwarded to the wrapped backend's `write_words` as
+    contiguous runs, so a register scan costs one transaction per run instead
+    of one per word. Issue order is preserved: a run only grows while each
+    write targets the word directly after the previous one, so writes with
+    side effects (e.g. a "start" bit after its operands) reach the hardware in
+    the same order they were made.
+
+    The queue is flushed when it reaches `burst` words, before every read (so
+    reads always observe earlier writes), and on `flush()` or leaving a `with`
+    block. Only synchronous backends are supported.
+
+    Reads are deliberately not coalesced. A read has to return its value
+    immediately, so it cannot wait in a queue for neighbours, and prefetching the
+    words after it would touch registers nobody asked for (read-to-clear status,
+    FIFO data ports). Callers that know they want a range use `read_words`, which
+    is passed straight through as one burst.
+    """
+
+    __slots__ = ("_backend", "_burst", "_queue")
+
+    def __init__(self, backend: AbstractBusInterface, burst: int = 64):
+        """
+        Initialize the wrapper.
+
+        Args:
+            backend: Synchronous bus interface that performs the transfers
+            burst: Maximum number of queued words before an automatic flush
+        """
+        self._backend = backend
+        self._burst = burst
+        self._queue: List[Tuple[int, int]] = []
+
+    def read_word(self, address: int) -> int:
+        self.flush()
+        return self._backend.read_word(address)
+
+    def write_word(self, address: int, data: int) -> None:
+        self._queue.append((address, data & 0xFFFFFFFF))
+        if len(self._queue) >= self._burst:
+            self.flush()
+
+    def read_words(self, address: int, count: int) -> List[int]:
+        self.flush()
+        return self._backend.read_words(address, count)
+
+    def write_words(self, address: int, values: List[int]) -> None:
+        for i, value in enumerate(values):
+            self.write_word(address + 4 * i, value)
+
+    def flush(self) -> None:
+        """Send all queued writes to the backend as contiguous runs."""
+        if not self._queue:
+            return
+        queue, self._queue = self._queue, []
+
+        run_base, run_values = queue[0][0], [queue[0][1]]
+        for address, value in queue[1:]:
+            if address == run_base + 4 * len(run_values):
+                run_values.append(value)
+            else:
+                self._write_run(run_base, run_values)
+                run_base, run_values = address, [value]
+        self._write_run(run_base, run_values)
+
+    def _write_run(self, address: int, values: List[int]) -> None:
+        if len(values) == 1:
+            self._backend.write_word(address, values[0])
         else:
-            raise ValueError(f"Unsupported bus_type: {bus_type}")
+            self._backend.write_words(address, values)
 
-    async def read_word(self, address: int) -> int:
-        msg = f"Reading from 0x{address:08X}"
-        if self.bus_type == "axil":
-            val = await self._driver.read(address, 4)
-            # val is ReadResult, val.data is bytes
-            return int.from_bytes(val.data, byteorder="little")
-        elif self.bus_type == "avmm":
-            # AvalonMaster.read(address, sync=True) -> returns data (LogicArray/int)
-            val = await self._driver.read(address)
-            # Ensure proper integer conversion
-            return int(val)
-        return 0
+    def __enter__(self) -> "BurstingBus":
+        return self
 
-    async def write_word(self, address: int, data: int) -> None:
-        if self.bus_type == "axil":
-            await self._driver.write(address, data.to_bytes(4, byteorder="little"))
-        elif self.bus_type == "avmm":
-            # AvalonMaster.write(address, value)
-            await self._driver.write(address, data)
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
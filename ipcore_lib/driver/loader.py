@@ -1,7 +1,7 @@
+import os
 from dataclasses import dataclass
-from typing import Any, Dict, List
-
-import yaml
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 from ipcore_lib.runtime.register import (
     AbstractBusInterface,
@@ -10,6 +10,24 @@ from ipcore_lib.runtime.register import (
     Register,
     RegisterArrayAccessor,
 )
+from ipcore_lib.utils.yaml_utils import safe_loader
+
+# Map standard YAML access strings to AccessType enum
+_ACCESS_MAP = {
+    "read-only": AccessType.RO,
+    "readonly": AccessType.RO,
+    "ro": AccessType.RO,
+    "write-only": AccessType.WO,
+    "writeonly": AccessType.WO,
+    "wo": AccessType.WO,
+    "read-write": AccessType.RW,
+    "readwrite": AccessType.RW,
+    "rw": AccessType.RW,
+    "write-1-to-clear": AccessType.RW1C,
+    "write1toclear": AccessType.RW1C,
+    "read-write-1-to-clear": AccessType.RW1C,
+    "rw1c": AccessType.RW1C,
+}
 
 
 @dataclass
@@ -28,23 +46,69 @@ class IpCoreDriver:
         self._bus = bus_interface
 
 
-def _parse_bits(bits_def: Any) -> tuple[int, int]:
+def _parse_bits(bits_def: Any) -> Tuple[int, int]:
     """Helper to parse 'bit: 0' (int) or 'bits: [7:4]' (str) into (offset, width)."""
     if isinstance(bits_def, int):
         return bits_def, 1
-    if isinstance(bits_def, str) and ":" in bits_def:
+    if isinstance(bits_def, str):
+        return _parse_bits_str(bits_def)
+    # Fallback/Default, e.g. a float from YAML
+    try:
+        return int(bits_def), 1
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid bit definition: {bits_def}") from None
+
+
+@lru_cache(maxsize=256)
+def _parse_bits_str(bits_def: str) -> Tuple[int, int]:
+    # Memoized: a memory map repeats the same handful of ranges ("[0:0]",
+    # "[7:0]", ...) across many fields
+    if ":" in bits_def:
         # Expected format like "[7:4]" or "7:4"
-        clean = bits_def.strip("[]")
-        high_s, low_s = clean.split(":")
+        high_s, low_s = bits_def.strip().strip("[]").split(":")
         high, low = int(high_s), int(low_s)
         return low, (high - low + 1)
-    # Fallback/Default
+    # Single bit given as a string, e.g. "3"
     try:
-        val = int(bits_def)
-        return val, 1
-    except:
-        pass
-    raise ValueError(f"Invalid bit definition: {bits_def}")
+        return int(bits_def), 1
+    except ValueError:
+        raise ValueError(f"Invalid bit definition: {bits_def}") from None
+
+
+@lru_cache(maxsize=None)
+def _normalize_access(access: str) -> str:
+    """
+    Resolve a YAML access string to the BitField access code ('ro', 'rw', ...).
+
+    Memoized since a memory map only uses a few distinct spellings. Returning
+    the code string rather than the AccessType member lets BitField skip its
+    enum-to-string normalization.
+    """
+    acc_str = access.lower()
+    # Clean up Enum string representation if present (e.g., "AccessType.READ_WRITE")
+    if "accesstype." in acc_str:
+        acc_str = acc_str.split(".")[-1]
+    # Normalize underscores and dashes
+    acc_str = acc_str.replace("_", "-")
+    return _ACCESS_MAP.get(acc_str, AccessType.RW).value
+
+
+@lru_cache(maxsize=16)
+def _load_yaml(yaml_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a memory map file, memoized on (path, modification time, size).
+
+    The mtime and size are part of the key so an edited file is re-parsed,
+    including rewrites that land within the filesystem's timestamp
+    granularity but change the file length. Callers
+    must treat the returned structure as read-only since it is shared.
+    """
+    # Deferred so that importing the driver package for Register or the bus
+    # classes alone does not pay for PyYAML
+    import yaml
+
+    with open(yaml_path, "r") as f:
+        return yaml.load(f, Loader=safe_loader())
 
 
 def load_driver(yaml_path: str, bus_interface: AbstractBusInterface) -> IpCoreDriver:
@@ -52,9 +116,10 @@ def load_driver(yaml_path: str, bus_interface: AbstractBusInterface) -> IpCoreDr
     Loads a memory map from a YAML file and returns a configured IpCoreDriver.
     """
     driver = IpCoreDriver(bus_interface)
+    bit_fields: Dict[Tuple[str, int, int, str, str], BitField] = {}
 
-    with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
+    stat = os.stat(yaml_path)
+    data = _load_yaml(os.path.abspath(yaml_path), stat.st_mtime_ns, stat.st_size)
 
     # Validation: data should be a list of maps, or a single map dict?
     # The generated yaml from VHDLGenerator might need to be checked.
@@ -105,43 +170,30 @@ def load_driver(yaml_path: str, bus_interface: AbstractBusInterface) -> IpCoreDr
 
                     offset, width = _parse_bits(bits_val)
 
-                    acc_str = field_info.get("access", "read-write").lower()
-                    # Clean up Enum string representation if present (e.g., "AccessType.READ_WRITE")
-                    if "accesstype." in acc_str:
-                        acc_str = acc_str.split(".")[-1]
-                    # Normalize underscores and dashes
-                    acc_str = acc_str.replace("_", "-")
-
-                    # Map standard YAML access strings to AccessType enum
-                    access_map = {
-                        "read-only": AccessType.RO,
-                        "readonly": AccessType.RO,
-                        "ro": AccessType.RO,
-                        "write-only": AccessType.WO,
-                        "writeonly": AccessType.WO,
-                        "wo": AccessType.WO,
-                        "read-write": AccessType.RW,
-                        "readwrite": AccessType.RW,
-                        "rw": AccessType.RW,
-                        "write-1-to-clear": AccessType.RW1C,
-                        "write1toclear": AccessType.RW1C,
-                        "read-write-1-to-clear": AccessType.RW1C,
-                        "rw1c": AccessType.RW1C,
-                    }
-                    access_type = access_map.get(acc_str, AccessType.RW)
-
-                    fields.append(
-                        BitField(
+                    access = _normalize_access(field_info.get("access", "read-write"))
+                    description = field_info.get("description", "")
+
+                    # Registers with identical field specs share one BitField, as
+                    # register array elements already share their field template
+                    field_key = (field_info["name"], offset, width, access, description)
+                    bit_field = bit_fields.get(field_key)
+                    if bit_field is None:
+                        bit_field = BitField(
                             name=field_info["name"],
                             offset=offset,
                             width=width,
-                            access=access_type,
-                            description=field_info.get("description", ""),
+                            access=access,
+                            description=description,
                         )
-                    )
+                        bit_fields[field_key] = bit_field
+                    fields.append(bit_field)
 
                 # Check for array
                 if "count" in reg_info:
+                    if reg_info.get("shadow"):
+                        # Array elements are built per access, so a shadow would
+                        # never outlive the element it belongs to
+                        raise ValueError(f"Register array '{reg_info['name']}' cannot be shadowed")
                     accessor = RegisterArrayAccessor(
                         name=reg_info["name"],
                         base_offset=reg_abs_offset,
@@ -157,6 +209,7 @@ def load_driver(yaml_path: str, bus_interface: AbstractBusInterface) -> IpCoreDr
                         offset=reg_abs_offset,
                         bus=bus_interface,
                         fields=fields,
+                        shadow=bool(reg_info.get("shadow", False)),
                     )
                     setattr(block_obj, reg_info["name"], register)
 
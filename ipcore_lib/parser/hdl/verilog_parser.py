@@ -2,6 +2,7 @@
 Verilog Parser module using pyparsing to parse Verilog module declarations.
 """
 
+import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -36,6 +37,8 @@ from pyparsing import (
 
 from ipcore_lib.model import VLNV, IpCore, Port, PortDirection
 
+logger = logging.getLogger(__name__)
+
 # Enable packrat parsing for better performance
 ParserElement.set_default_whitespace_chars(" \t\n\r")
 ParserElement.enable_packrat()
@@ -155,7 +158,7 @@ class VerilogParser:
 
         # Check if "module" keyword exists in text
         if "module" not in verilog_text.lower():
-            print("Warning: No 'module' keyword found in Verilog text")
+            logger.warning("No 'module' keyword found in Verilog text")
             return result
 
         # Try regex approach first (more flexible with different formatting)
@@ -169,8 +172,8 @@ class VerilogParser:
                 module_name = module_match.group(1)
                 ports_text = module_match.group(2)
 
-                print(f"Regex found module: {module_name}")
-                print(f"Ports text: {ports_text}")
+                logger.debug("Regex found module: %s", module_name)
+                logger.debug("Ports text: %s", ports_text)
 
                 ports = []
 
@@ -182,7 +185,7 @@ class VerilogParser:
                 ansi_ports = re.findall(ansi_port_pattern, ports_text, re.IGNORECASE)
 
                 if ansi_ports:
-                    print(f"Found {len(ansi_ports)} ANSI-style ports")
+                    logger.debug("Found %d ANSI-style ports", len(ansi_ports))
                     # Process ANSI-style ports
                     for port_match in ansi_ports:
                         direction_str = port_match[0].lower()
@@ -195,8 +198,13 @@ class VerilogParser:
                         msb = int(msb_str) if msb_str else None
                         lsb = int(lsb_str) if lsb_str else None
 
-                        print(
-                            f"Found port: {port_name}, direction: {direction_str}, type: {port_type}, range: {msb}:{lsb}"
+                        logger.debug(
+                            "Found port: %s, direction: %s, type: %s, range: %s:%s",
+                            port_name,
+                            direction_str,
+                            port_type,
+                            msb,
+                            lsb,
                         )
 
                         # Create port
@@ -238,18 +246,18 @@ class VerilogParser:
                 return result
 
         except Exception as e:
-            print(f"Error in regex parsing: {e}")
+            logger.warning("Error in regex parsing: %s", e)
 
         # If regex approach didn't work, try the pyparsing approach
         if result["module"] is None:
             try:
-                print("Trying pyparsing approach for module")
+                logger.debug("Trying pyparsing approach for module")
                 module_match = self.module_decl.search_string(verilog_text)
                 if module_match and len(module_match) > 0:
                     module_data = module_match[0]
                     result["module"] = self._create_ip_core(module_data)
             except Exception as e:
-                print(f"Error parsing module with pyparsing: {e}")
+                logger.warning("Error parsing module with pyparsing: %s", e)
 
         return result
 
@@ -15,11 +15,16 @@ Benefits:
     - No grammar maintenance needed
 """
 
+import hashlib
 import json
 import logging
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -33,6 +38,150 @@ from ipcore_lib.model.port import Port, PortDirection
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# LLM Prompts
+# ============================================================================
+
+_ENTITY_SYSTEM_PROMPT = """You are an expert VHDL parser. Parse the provided VHDL code and extract structured information.
+
+Return ONLY valid JSON (no markdown, no explanation) with this structure:
+{
+    "entity_name": "string",
+    "description": "brief 1-2 sentence description",
+    "generics": [
+    {
+            "name": "string",
+            "type": "string (e.g., integer, std_logic_vector)",
+            "default": "string or null"
+    }
+    ],
+    "ports": [
+    {
+            "name": "string",
+            "direction": "in|out|inout",
+            "type": "string (e.g., std_logic, std_logic_vector)",
+            "width": number (1 for std_logic, N for vectors),
+            "range": "string (e.g., '7 downto 0') or null"
+    }
+    ],
+    "bus_interfaces": [
+    {
+            "name": "string (e.g., s_axi)",
+            "type": "string (e.g., AXI4_LITE, AXI_STREAM, AVALON_MM)",
+            "mode": "master|slave|source|sink",
+            "physical_prefix": "string (e.g., s_axi_)",
+            "signals": ["list of signal names in this interface"]
+    }
+    ]
+}
+
+Common bus interface types and their signals:
+- AXI4_LITE: awaddr, awvalid, awready, wdata, wstrb, wvalid, wready, bresp, bvalid, bready, araddr, arvalid, arready, rdata, rresp, rvalid, rready
+- AXI4_FULL: Same as AXI4_LITE plus awid, awlen, awsize, awburst, awlock, awcache, awprot, awqos, bid, arid, arlen, arsize, arburst, arlock, arcache, arprot, arqos, rid, rlast
+- AXI_STREAM: tdata, tvalid, tready, tlast, tkeep, tstrb, tuser, tid, tdest
+- AVALON_MM: address, writedata, readdata, write, read, waitrequest, byteenable, readdatavalid
+- WISHBONE: adr, dat_i, dat_o, we, cyc, stb, ack, err, rty, sel
+- SPI: sclk/sck/clk, mosi/sdo/dout, miso/sdi/din, cs/cs_n/ss/ss_n (chip select can be active high or low)
+- I2C: scl/sclk (clock), sda (data), may have separate sda_i/sda_o/sda_t (tristate control)
+- UART: tx/txd/uart_tx (transmit), rx/rxd/uart_rx (receive), may have rts/cts (flow control)
+- JTAG: tck (clock), tms (mode select), tdi (data in), tdo (data out), trst_n (reset, optional)
+- APB: paddr, psel, penable, pwrite, pwdata, prdata, pready, pslverr
+
+For width calculation:
+- std_logic = 1
+- std_logic_vector(7 downto 0) = 8
+- std_logic_vector(N-1 downto 0) = N
+- Handle arithmetic expressions like (C_WIDTH-1 downto 0), (C_WIDTH/8)-1 downto 0)
+
+Identify bus interfaces by:
+1. Signal naming prefixes (s_axi_, m_axis_, avmm_, wb_, apb_)
+2. Comments mentioning bus types (AXI, SPI, I2C, UART, Wishbone, Avalon)
+3. Standard signal patterns matching common interfaces
+4. Naming conventions (spi_sclk, i2c_scl, uart_tx indicate specific bus types)
+
+Bus interface naming guidelines:
+- Group related signals with common prefixes or suffixes
+- SPI: Look for sclk/sck + mosi/miso + cs combinations
+- I2C: Look for scl + sda pairs (may be bidirectional with _i/_o/_t suffixes)
+- UART: Look for tx/rx pairs (may include rts/cts for flow control)
+- Master vs Slave: Masters typically drive clock/control, slaves respond
+- Direction: Master initiates transfers, slave responds"""
+
+_BATCH_SYSTEM_PROMPT = _ENTITY_SYSTEM_PROMPT + """
+
+You may be given several VHDL files at once, each introduced by a "### FILE <n>: <name>" header.
+In that case return ONLY a JSON array containing exactly one object of the structure above
+per file, in the same order as the files."""
+
+
+# Part of the parse cache key. Bump it whenever the way LLM output is turned into an
+# IpCore (_build_ip_core_from_llm) changes, so stale cache entries are not served.
+_CACHE_FORMAT_VERSION = "1"
+
+# Entity declaration. Ports, generics and bus hints all live here (plus the comment
+# block directly above it); architecture bodies only cost prompt tokens. The body
+# consumes "--" comments whole, up to the end of their line, so an "end;" inside a
+# comment cannot terminate the block; "-" only matches on its own when it does not
+# start a comment, so there is a single way to consume each comment.
+_ENTITY_BLOCK_RE = re.compile(
+    r"^[ \t]*entity\s+(\w+)\s+is\b"
+    r"(?:--[^\n]*(?![^\n])|[^-]|-(?!-))*?"
+    r"\bend\s*(?:entity\s*)?(?:\1\s*)?;",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
+
+# JSON payloads in LLM responses, inside a markdown fence or bare
+_FENCED_OBJECT_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_FENCED_ARRAY_RE = re.compile(r"```(?:json)?\s*(\[.*?\])\s*```", re.DOTALL)
+_BARE_OBJECT_RE = re.compile(r"(\{.*\})", re.DOTALL)
+_BARE_ARRAY_RE = re.compile(r"(\[.*\])", re.DOTALL)
+
+
+def _extract_entity_block(vhdl_text: str) -> str:
+    """Reduce VHDL source to its entity declaration(s), or return it unchanged if none match."""
+    blocks = []
+    prev_end = 0
+    for match in _ENTITY_BLOCK_RE.finditer(vhdl_text):
+        # Walk back over the comment lines directly above the entity. Done in code
+        # rather than as a leading regex group, which re-scans long comment runs
+        # from every line and goes quadratic.
+        start = match.start()
+        while start > prev_end:
+            line_start = vhdl_text.rfind("\n", prev_end, start - 1) + 1
+            line = vhdl_text[line_start : start - 1]
+            if line_start < prev_end or not line.lstrip(" \t").startswith("--"):
+                break
+            start = line_start
+        blocks.append(vhdl_text[start : match.end()])
+        prev_end = match.end()
+    return "\n\n".join(blocks) if blocks else vhdl_text
+
+
+def _entity_names(vhdl_text: str) -> Set[str]:
+    """Lower-cased names of the entities declared in a VHDL source."""
+    return {match.group(1).lower() for match in _ENTITY_BLOCK_RE.finditer(vhdl_text)}
+
+
+def _extract_json_text(response: str, array: bool = False) -> str:
+    """Strip markdown fences/prose around a JSON object (or array) in an LLM response."""
+    response_clean = response.strip()
+
+    # Extract JSON from markdown code blocks if present
+    if "```" in response_clean:
+        fenced_re, bare_re = (
+            (_FENCED_ARRAY_RE, _BARE_ARRAY_RE) if array else (_FENCED_OBJECT_RE, _BARE_OBJECT_RE)
+        )
+        json_match = fenced_re.search(response_clean)
+        if json_match:
+            return json_match.group(1)
+        # Try to find JSON directly
+        json_match = bare_re.search(response_clean)
+        if json_match:
+            return json_match.group(1)
+
+    return response_clean
+
+
 # ============================================================================
 # Configuration Models
 # ============================================================================
@@ -55,6 +204,21 @@ class ParserConfig(BaseModel):
         default=False, description="Fail on parsing errors (vs graceful degradation)"
     )
     max_retries: int = Field(default=2, description="Max retries if LLM response is invalid")
+    batch_size: int = Field(
+        default=1, ge=1, description="Number of files marshaled into one LLM prompt by parse_files"
+    )
+    prefilter: bool = Field(
+        default=True, description="Send only entity declarations to the LLM, not the full file"
+    )
+    max_workers: int = Field(
+        default=4, ge=1, description="Max concurrent LLM requests issued by parse_files"
+    )
+
+    # Result caching
+    cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached parse results keyed on source hash (disabled if None)",
+    )
 
     model_config = {"extra": "forbid"}
 
@@ -82,6 +246,9 @@ class VhdlLlmParser:
         self.provider = None
         self.provider_name = provider_name
         self.model_name = model_name
+        self._client = None
+        # parse_files calls in from several worker threads
+        self._client_lock = threading.Lock()
 
         # Lazy loading: only import and initialize if needed
         self._initialize_provider()
@@ -131,6 +298,20 @@ class VhdlLlmParser:
 
         return self.provider.api_key is not None
 
+    def _get_client(self) -> Any:
+        """
+        Get the provider client, creating it on first use.
+
+        The client owns the HTTP connection pool, so reusing it across calls keeps
+        connections alive instead of paying a new TCP/TLS handshake per parse.
+        """
+        if self._client is None:
+            with self._client_lock:
+                # Re-check: another thread may have created it while we waited
+                if self._client is None:
+                    self._client = self.provider.get_client()
+        return self._client
+
     def parse_vhdl_entity(self, vhdl_text: str) -> Dict[str, Any]:
         """
         Parse VHDL entity using LLM to extract all information.
@@ -144,71 +325,6 @@ class VhdlLlmParser:
         if not self.is_available():
             raise RuntimeError("LLM provider not available. Cannot parse VHDL without LLM.")
 
-        system_prompt = """You are an expert VHDL parser. Parse the provided VHDL code and extract structured information.
-
-Return ONLY valid JSON (no markdown, no explanation) with this structure:
-{
-    "entity_name": "string",
-    "description": "brief 1-2 sentence description",
-    "generics": [
-    {
-            "name": "string",
-            "type": "string (e.g., integer, std_logic_vector)",
-            "default": "string or null"
-    }
-    ],
-    "ports": [
-    {
-            "name": "string",
-            "direction": "in|out|inout",
-            "type": "string (e.g., std_logic, std_logic_vector)",
-            "width": number (1 for std_logic, N for vectors),
-            "range": "string (e.g., '7 downto 0') or null"
-    }
-    ],
-    "bus_interfaces": [
-    {
-            "name": "string (e.g., s_axi)",
-            "type": "string (e.g., AXI4_LITE, AXI_STREAM, AVALON_MM)",
-            "mode": "master|slave|source|sink",
-            "physical_prefix": "string (e.g., s_axi_)",
-            "signals": ["list of signal names in this interface"]
-    }
-    ]
-}
-
-Common bus interface types and their signals:
-- AXI4_LITE: awaddr, awvalid, awready, wdata, wstrb, wvalid, wready, bresp, bvalid, bready, araddr, arvalid, arready, rdata, rresp, rvalid, rready
-- AXI4_FULL: Same as AXI4_LITE plus awid, awlen, awsize, awburst, awlock, awcache, awprot, awqos, bid, arid, arlen, arsize, arburst, arlock, arcache, arprot, arqos, rid, rlast
-- AXI_STREAM: tdata, tvalid, tready, tlast, tkeep, tstrb, tuser, tid, tdest
-- AVALON_MM: address, writedata, readdata, write, read, waitrequest, byteenable, readdatavalid
-- WISHBONE: adr, dat_i, dat_o, we, cyc, stb, ack, err, rty, sel
-- SPI: sclk/sck/clk, mosi/sdo/dout, miso/sdi/din, cs/cs_n/ss/ss_n (chip select can be active high or low)
-- I2C: scl/sclk (clock), sda (data), may have separate sda_i/sda_o/sda_t (tristate control)
-- UART: tx/txd/uart_tx (transmit), rx/rxd/uart_rx (receive), may have rts/cts (flow control)
-- JTAG: tck (clock), tms (mode select), tdi (data in), tdo (data out), trst_n (reset, optional)
-- APB: paddr, psel, penable, pwrite, pwdata, prdata, pready, pslverr
-
-For width calculation:
-- std_logic = 1
-- std_logic_vector(7 downto 0) = 8
-- std_logic_vector(N-1 downto 0) = N
-- Handle arithmetic expressions like (C_WIDTH-1 downto 0), (C_WIDTH/8)-1 downto 0)
-
-Identify bus interfaces by:
-1. Signal naming prefixes (s_axi_, m_axis_, avmm_, wb_, apb_)
-2. Comments mentioning bus types (AXI, SPI, I2C, UART, Wishbone, Avalon)
-3. Standard signal patterns matching common interfaces
-4. Naming conventions (spi_sclk, i2c_scl, uart_tx indicate specific bus types)
-
-Bus interface naming guidelines:
-- Group related signals with common prefixes or suffixes
-- SPI: Look for sclk/sck + mosi/miso + cs combinations
-- I2C: Look for scl + sda pairs (may be bidirectional with _i/_o/_t suffixes)
-- UART: Look for tx/rx pairs (may include rts/cts for flow control)
-- Master vs Slave: Masters typically drive clock/control, slaves respond
-- Direction: Master initiates transfers, slave responds"""
-
         user_prompt = f"""Parse this VHDL entity and return structured JSON:
 
 ```vhdl
@@ -218,25 +334,11 @@ Bus interface naming guidelines:
 Return complete JSON with all fields filled:"""
 
         try:
-            client = self.provider.get_client()
-            response = self.provider.summarize(client, user_prompt, system_prompt, "")
-
-            # Clean response
-            response_clean = response.strip()
-
-            # Extract JSON from markdown code blocks if present
-            if "```" in response_clean:
-                json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", response_clean, re.DOTALL)
-                if json_match:
-                    response_clean = json_match.group(1)
-                else:
-                    # Try to find JSON object directly
-                    json_match = re.search(r"(\{.*\})", response_clean, re.DOTALL)
-                    if json_match:
-                        response_clean = json_match.group(1)
+            client = self._get_client()
+            response = self.provider.summarize(client, user_prompt, _ENTITY_SYSTEM_PROMPT, "")
 
             # Parse JSON
-            parsed_data = json.loads(response_clean)
+            parsed_data = json.loads(_extract_json_text(response))
 
             logger.info(
                 f"LLM successfully parsed entity: {parsed_data.get('entity_name', 'unknown')}"
@@ -257,6 +359,59 @@ Return complete JSON with all fields filled:"""
             logger.error(f"VHDL parsing failed: {e}")
             raise
 
+    def parse_vhdl_entities(
+        self, vhdl_texts: List[str], source_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse several VHDL entities with a single LLM request.
+
+        The sources are marshaled into one prompt and the LLM returns a JSON array,
+        so the fixed per-request cost (system prompt, network round-trip, rate limit
+        slot) is paid once for the whole batch.
+
+        Args:
+            vhdl_texts: VHDL source codes
+            source_names: Optional file names used as headers in the prompt
+
+        Returns:
+            List of dicts (same structure as parse_vhdl_entity), one per source, in order
+
+        Raises:
+            ValueError: If the response is not a JSON array with one entry per source
+        """
+        if not self.is_available():
+            raise RuntimeError("LLM provider not available. Cannot parse VHDL without LLM.")
+
+        names = source_names or [f"file{i + 1}.vhd" for i in range(len(vhdl_texts))]
+        sections = "\n\n".join(
+            f"### FILE {i + 1}: {name}\n```vhdl\n{text}\n```"
+            for i, (name, text) in enumerate(zip(names, vhdl_texts))
+        )
+        user_prompt = f"""Parse the following {len(vhdl_texts)} VHDL files and return a JSON array with one object per file, in order:
+
+{sections}
+
+Return the complete JSON array:"""
+
+        response = ""
+        try:
+            client = self._get_client()
+            response = self.provider.summarize(client, user_prompt, _BATCH_SYSTEM_PROMPT, "")
+            parsed_list = json.loads(_extract_json_text(response, array=True))
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM JSON response: {e}")
+            logger.debug(f"Response was: {response[:500]}")
+            raise ValueError(f"LLM returned invalid JSON: {e}")
+
+        if not isinstance(parsed_list, list) or len(parsed_list) != len(vhdl_texts):
+            raise ValueError(
+                f"LLM returned {len(parsed_list) if isinstance(parsed_list, list) else 'no'} "
+                f"entities for a batch of {len(vhdl_texts)} files"
+            )
+
+        logger.info(f"LLM successfully parsed batch of {len(parsed_list)} entities")
+        return parsed_list
+
 
 # ============================================================================
 # Main AI-Enhanced Parser
@@ -308,6 +463,75 @@ class VHDLAiParser:
         vhdl_text = file_path.read_text()
         return self.parse_text(vhdl_text, source_name=file_path.name)
 
+    def parse_files(self, file_paths: List[Path]) -> List[IpCore]:
+        """
+        Parse several VHDL files and return one IpCore model per file.
+
+        Uncached files are sent to the LLM in groups of ``config.batch_size``
+        per prompt, with up to ``config.max_workers`` requests in flight at once.
+        If a batched response cannot be used, the files in that group are
+        re-parsed one by one.
+
+        Args:
+            file_paths: Paths to VHDL files
+
+        Returns:
+            Validated IpCore models, in the same order as file_paths
+        """
+        sources = [(Path(path).read_text(), Path(path).name) for path in file_paths]
+        batch_size = self.config.batch_size
+        batches = [
+            sources[start : start + batch_size] for start in range(0, len(sources), batch_size)
+        ]
+
+        if self.config.max_workers > 1 and len(batches) > 1:
+            # LLM calls are network-bound, so threads overlap the waits
+            with ThreadPoolExecutor(max_workers=min(self.config.max_workers, len(batches))) as pool:
+                batch_results = list(pool.map(self._parse_batch, batches))
+        else:
+            batch_results = [self._parse_batch(batch) for batch in batches]
+
+        return [ip_core for batch in batch_results for ip_core in batch]
+
+    def _parse_batch(self, sources: List[Tuple[str, str]]) -> List[IpCore]:
+        """Parse a group of (vhdl_text, source_name) pairs with one LLM request."""
+        if len(sources) == 1:
+            return [self.parse_text(text, source_name=name) for text, name in sources]
+
+        if self.config.prefilter:
+            sources = [(_extract_entity_block(text), name) for text, name in sources]
+
+        results: List[Optional[IpCore]] = [self._load_cached(text) for text, _ in sources]
+        pending = [i for i, cached in enumerate(results) if cached is None]
+
+        # Uncached files left over here go through parse_text, which handles an
+        # unavailable LLM
+        if len(pending) > 1 and self.llm_parser.is_available():
+            try:
+                parsed_list = self.llm_parser.parse_vhdl_entities(
+                    [sources[i][0] for i in pending], [sources[i][1] for i in pending]
+                )
+                for i, parsed_data in zip(pending, parsed_list):
+                    text, name = sources[i]
+                    # Entries are matched to files by position, so make sure the LLM
+                    # kept the order before trusting (and caching) the result
+                    entity_name = str(parsed_data.get("entity_name", "")).lower()
+                    if entity_name not in _entity_names(text):
+                        logger.warning(
+                            f"Batched result for {name} describes entity '{entity_name}', "
+                            f"re-parsing the file on its own"
+                        )
+                        continue
+                    results[i] = self._build_ip_core_from_llm(parsed_data, name)
+                    self._store_cached(text, results[i])
+            except Exception as e:
+                logger.warning(f"Batched parse failed ({e}), falling back to per-file parsing")
+
+        return [
+            result if result is not None else self.parse_text(text, source_name=name)
+            for result, (text, name) in zip(results, sources)
+        ]
+
     def parse_text(self, vhdl_text: str, source_name: str = "unknown") -> IpCore:
         """
         Parse VHDL text and return IpCore model using LLM.
@@ -319,6 +543,15 @@ class VHDLAiParser:
         Returns:
             Validated IpCore model
         """
+        if self.config.prefilter:
+            vhdl_text = _extract_entity_block(vhdl_text)
+
+        # A cache hit needs no LLM, so look it up before the availability check
+        cached = self._load_cached(vhdl_text)
+        if cached is not None:
+            logger.info(f"Using cached parse result for {source_name}")
+            return cached
+
         if not self.llm_parser.is_available():
             if self.config.strict_mode:
                 raise RuntimeError("LLM not available, cannot parse VHDL")
@@ -349,7 +582,58 @@ class VHDLAiParser:
             return self._create_minimal_ipcore(source_name)
 
         # Build canonical IpCore model from LLM response
-        return self._build_ip_core_from_llm(parsed_data, source_name)
+        ip_core = self._build_ip_core_from_llm(parsed_data, source_name)
+        self._store_cached(vhdl_text, ip_core)
+        return ip_core
+
+    def _cache_path(self, vhdl_text: str) -> Optional[Path]:
+        """
+        Get the cache file for a VHDL source.
+
+        The key covers the source, provider and model, plus the system prompts and
+        _CACHE_FORMAT_VERSION, so editing either invalidates earlier results.
+        """
+        if self.config.cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            "\0".join(
+                (
+                    vhdl_text,
+                    self.config.llm_provider,
+                    self.config.llm_model,
+                    _CACHE_FORMAT_VERSION,
+                    _ENTITY_SYSTEM_PROMPT,
+                    _BATCH_SYSTEM_PROMPT,
+                )
+            ).encode()
+        ).hexdigest()
+        return Path(self.config.cache_dir) / f"{key}.json"
+
+    def _load_cached(self, vhdl_text: str) -> Optional[IpCore]:
+        """Return the cached IpCore for a VHDL source, or None on a cache miss."""
+        cache_path = self._cache_path(vhdl_text)
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            # pydantic-core parses raw bytes natively; skip the str decode
+            return IpCore.model_validate_json(cache_path.read_bytes())
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path.name}: {e}")
+            return None
+
+    def _store_cached(self, vhdl_text: str, ip_core: IpCore) -> None:
+        """Write a parse result to the cache (atomically, so readers never see partial files)."""
+        cache_path = self._cache_path(vhdl_text)
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(ip_core.model_dump_json().encode())
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {cache_path.name}: {e}")
 
     def _create_minimal_ipcore(self, source_name: str) -> IpCore:
         """Create minimal valid IpCore when parsing fails."""
@@ -8,7 +8,7 @@ operations, field validation, and access control.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 
@@ -29,6 +29,13 @@ class AccessType(Enum):
     RW1C = "rw1c"  # Read-write-1-to-clear
 
 
+# Access codes accepted as strings by BitField, built once rather than per field
+_VALID_ACCESS = frozenset(at.value for at in AccessType)
+
+# Plain Register attributes that __setattr__ must never treat as field names
+_REGISTER_ATTRS = frozenset(("name", "offset", "description"))
+
+
 @dataclass
 class BitField:
     """
@@ -73,10 +80,9 @@ class BitField:
             self.access = self.access.value
         elif isinstance(self.access, str):
             # Validate string access types
-            valid_access = {at.value for at in AccessType}
-            if self.access not in valid_access:
+            if self.access not in _VALID_ACCESS:
                 raise ValueError(
-                    f"Bit field '{self.name}' access must be one of {valid_access}, got '{self.access}'"
+                    f"Bit field '{self.name}' access must be one of {set(_VALID_ACCESS)}, got '{self.access}'"
                 )
         else:
             raise ValueError(
@@ -107,15 +113,15 @@ class BitField:
 
     def insert_value(self, register_value: int, field_value: int) -> int:
         """Insert this field's value into a complete register value."""
-        if field_value > self.max_value:
-            raise ValueError(
-                f"Value {field_value} exceeds field '{self.name}' maximum {self.max_value}"
-            )
+        # Masks are derived per call rather than cached on the instance because
+        # editors (e.g. the memory map editor) resize and move fields in place
+        max_value = (1 << self.width) - 1
+        if field_value > max_value:
+            raise ValueError(f"Value {field_value} exceeds field '{self.name}' maximum {max_value}")
 
-        # Clear the field bits
-        cleared_value = register_value & ~self.mask
-        # Insert the new field value
-        return cleared_value | ((field_value << self.offset) & self.mask)
+        mask = max_value << self.offset
+        # Clear the field bits, then insert the new field value
+        return (register_value & ~mask) | ((field_value << self.offset) & mask)
 
 
 class AbstractBusInterface(ABC):
@@ -126,6 +132,9 @@ class AbstractBusInterface(ABC):
     without creating circular dependencies.
     """
 
+    # Empty so that subclasses declaring __slots__ get no per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def read_word(self, address: int) -> int:
         """Read a 32-bit word from the specified address."""
@@ -136,6 +145,37 @@ class AbstractBusInterface(ABC):
         """Write a 32-bit word to the specified address."""
         pass
 
+    def read_words(self, address: int, count: int) -> List[int]:
+        """
+        Read `count` consecutive 32-bit words starting at the specified address.
+
+        The default implementation falls back to one `read_word` per word.
+        Backends with a native burst/block transfer should override this so
+        that the whole range is fetched in a single transaction.
+
+        Args:
+            address: Byte address of the first word
+            count: Number of 32-bit words to read
+
+        Returns:
+            List of word values, in ascending address order
+        """
+        return [self.read_word(address + 4 * i) for i in range(count)]
+
+    def write_words(self, address: int, values: List[int]) -> None:
+        """
+        Write consecutive 32-bit words starting at the specified address.
+
+        The default implementation falls back to one `write_word` per word.
+        Backends with a native burst/block transfer should override this.
+
+        Args:
+            address: Byte address of the first word
+            values: Word values to write, in ascending address order
+        """
+        for i, value in enumerate(values):
+            self.write_word(address + 4 * i, value)
+
 
 class Register:
     """
@@ -152,6 +192,7 @@ class Register:
     - Read-modify-write operations for partial register updates
     - Register-level read/write operations
     - Field enumeration and introspection
+    - Optional write-through shadow that saves bus reads on software-owned registers
     """
 
     def __init__(
@@ -161,6 +202,7 @@ class Register:
         bus: AbstractBusInterface,
         fields: List[BitField],
         description: str = "",
+        shadow: bool = False,
     ):
         """
         Initialize a register with bit field definitions.
@@ -171,34 +213,63 @@ class Register:
             bus: Bus interface for hardware communication
             fields: List of bit field definitions for this register
             description: Optional description of the register's purpose
+            shadow: Keep a copy of the last value written to (or read from) the
+                register and use it for reads of read-write fields and as the
+                base of field read-modify-writes instead of reading the bus
+                again. `read()` and write-1-to-clear field reads always go to
+                the bus. Write-only and write-1-to-clear bits are never kept, so
+                a later read-modify-write does not replay them. Only enable this
+                for registers that the hardware never modifies on its own.
 
         Raises:
-            ValueError: If bit fields overlap or extend beyond register boundaries
+            ValueError: If bit fields overlap or extend beyond register boundaries,
+                or if a shadowed register has read-only fields
         """
         self.name = name
         self.offset = offset
         self.description = description
         self._bus = bus
         self._fields: Dict[str, BitField] = {}
+        self._shadow_enabled = shadow
+        self._shadow: Optional[int] = None
+        self._shadow_mask = 0xFFFFFFFF
 
         # Validate and register bit fields
         self._validate_and_register_fields(fields)
 
+        if shadow:
+            self._init_shadow_mask()
+
+    def _init_shadow_mask(self) -> None:
+        """Reject hardware-owned fields and work out which bits the shadow may keep."""
+        for field in self._fields.values():
+            if field.access == "ro":
+                raise ValueError(
+                    f"Register '{self.name}' cannot be shadowed: field '{field.name}' is read-only"
+                )
+            if field.access in ("wo", "rw1c"):
+                # Strobe and clear bits act on the write that carries them; keeping
+                # them would re-fire them on the next read-modify-write
+                self._shadow_mask &= ~field.mask
+
     def _validate_and_register_fields(self, fields: List[BitField]) -> None:
         """Validate bit field definitions and check for overlaps."""
         # Check for field name uniqueness and overlaps
-        used_bits = [False] * 32
+        used_bits = 0
 
         for field in fields:
             # Check for duplicate field names
             if field.name in self._fields:
                 raise ValueError(f"Duplicate field name '{field.name}' in register '{self.name}'")
 
-            # Check for bit overlap
-            for bit_pos in range(field.offset, field.offset + field.width):
-                if used_bits[bit_pos]:
-                    raise ValueError(f"Bit overlap in register '{self.name}' at bit {bit_pos}")
-                used_bits[bit_pos] = True
+            # Check for bit overlap with a single AND against the bitmap of bits
+            # claimed so far, reporting the lowest clashing bit
+            field_bits = ((1 << field.width) - 1) << field.offset
+            overlap = used_bits & field_bits
+            if overlap:
+                bit_pos = (overlap & -overlap).bit_length() - 1
+                raise ValueError(f"Bit overlap in register '{self.name}' at bit {bit_pos}")
+            used_bits |= field_bits
 
             self._fields[field.name] = field
 
@@ -209,7 +280,10 @@ class Register:
         Returns:
             The 32-bit register value
         """
-        return self._bus.read_word(self.offset)
+        value = self._bus.read_word(self.offset)
+        if self._shadow_enabled:
+            self._shadow = value & self._shadow_mask
+        return value
 
     def write(self, value: int) -> None:
         """
@@ -221,6 +295,34 @@ class Register:
         # Ensure value fits in 32 bits
         value = value & 0xFFFFFFFF
         self._bus.write_word(self.offset, value)
+        if self._shadow_enabled:
+            self._shadow = value & self._shadow_mask
+
+    def _current_value(self) -> int:
+        """Current register value, taken from the shadow when it is valid."""
+        if self._shadow is not None:
+            return self._shadow
+        return self.read()
+
+    def _field_read_value(self, field: BitField) -> int:
+        """
+        Register value to extract `field` from.
+
+        Only read-write fields are software-owned and served from the shadow;
+        anything the hardware may set (e.g. write-1-to-clear flags) reads the bus.
+        """
+        if field.access == "rw":
+            return self._current_value()
+        return self.read()
+
+    def invalidate_shadow(self) -> None:
+        """
+        Discard the shadowed value so the next read-modify-write reads the bus.
+
+        Call this after the register may have changed behind the driver's back,
+        e.g. after a hardware reset.
+        """
+        self._shadow = None
 
     @property
     def reset_value(self) -> int:
@@ -250,14 +352,14 @@ class Register:
         Raises:
             ValueError: If field doesn't exist or is write-only
         """
-        if field_name not in self._fields:
+        field = self._fields.get(field_name)
+        if field is None:
             raise ValueError(f"Register '{self.name}' has no field named '{field_name}'")
 
-        field = self._fields[field_name]
         if field.access == "wo":
             raise ValueError(f"Field '{field_name}' in register '{self.name}' is write-only")
 
-        reg_value = self.read()
+        reg_value = self._field_read_value(field)
         return field.extract_value(reg_value)
 
     def write_field(self, field_name: str, value: int) -> None:
@@ -274,10 +376,10 @@ class Register:
         Raises:
             ValueError: If field doesn't exist, is read-only, or value is out of range
         """
-        if field_name not in self._fields:
+        field = self._fields.get(field_name)
+        if field is None:
             raise ValueError(f"Register '{self.name}' has no field named '{field_name}'")
 
-        field = self._fields[field_name]
         if field.access == "ro":
             raise ValueError(f"Field '{field_name}' in register '{self.name}' is read-only")
 
@@ -288,11 +390,11 @@ class Register:
 
         if field.access == "rw":
             # Read-modify-write for read-write fields
-            reg_value = self.read()
+            reg_value = self._current_value()
             new_reg_value = field.insert_value(reg_value, value)
         elif field.access == "rw1c":
             # Read-write-1-to-clear: writing 1 clears the bit, writing 0 has no effect
-            reg_value = self.read()
+            reg_value = self._current_value()
             # Only clear bits where value has 1s, preserve bits where value has 0s
             clear_mask = (value << field.offset) & field.mask
             new_reg_value = reg_value & ~clear_mask
@@ -302,6 +404,25 @@ class Register:
 
         self.write(new_reg_value)
 
+    def write_masked(self, mask: int, value: int) -> None:
+        """
+        Update the register bits selected by a mask, bypassing field lookup.
+
+        This is the fast path for code that already works in register
+        coordinates (e.g. a pin bitmap): one read-modify-write, or a plain
+        write when the mask covers the whole register. Unlike `write_field`,
+        no per-field access or range checks are applied.
+
+        Args:
+            mask: Bits of the register to update
+            value: New value of those bits, already shifted into position
+        """
+        mask &= 0xFFFFFFFF
+        if mask == 0xFFFFFFFF:
+            self.write(value)
+        else:
+            self.write((self._current_value() & ~mask) | (value & mask))
+
     def read_all_fields(self) -> Dict[str, int]:
         """
         Read all readable fields in the register.
@@ -312,7 +433,12 @@ class Register:
         Note:
             Write-only fields are excluded from the result
         """
-        reg_value = self.read()
+        if self._shadow is not None and all(
+            field.access in ("rw", "wo") for field in self._fields.values()
+        ):
+            reg_value = self._shadow
+        else:
+            reg_value = self.read()
         result = {}
 
         for field_name, field in self._fields.items():
@@ -336,10 +462,10 @@ class Register:
         """
         # Validate all fields first
         for field_name, value in field_values.items():
-            if field_name not in self._fields:
+            field = self._fields.get(field_name)
+            if field is None:
                 raise ValueError(f"Register '{self.name}' has no field named '{field_name}'")
 
-            field = self._fields[field_name]
             if field.access == "ro":
                 raise ValueError(f"Field '{field_name}' in register '{self.name}' is read-only")
 
@@ -354,7 +480,7 @@ class Register:
         )
 
         if has_read_fields:
-            reg_value = self.read()
+            reg_value = self._current_value()
         else:
             reg_value = 0
 
@@ -392,10 +518,11 @@ class Register:
         Raises:
             ValueError: If field doesn't exist
         """
-        if field_name not in self._fields:
+        field = self._fields.get(field_name)
+        if field is None:
             raise ValueError(f"Register '{self.name}' has no field named '{field_name}'")
 
-        return self._fields[field_name]
+        return field
 
     def reset(self) -> None:
         """
@@ -427,7 +554,9 @@ class Register:
         """
         result = self._bus.read_word(self.offset)
         if hasattr(result, "__await__"):
-            return await result
+            result = await result
+        if self._shadow_enabled:
+            self._shadow = result & self._shadow_mask
         return result
 
     async def write_async(self, value: int) -> None:
@@ -443,6 +572,8 @@ class Register:
         result = self._bus.write_word(self.offset, value)
         if hasattr(result, "__await__"):
             await result
+        if self._shadow_enabled:
+            self._shadow = value & self._shadow_mask
 
     async def read_field_async(self, field_name: str) -> int:
         """
@@ -457,14 +588,17 @@ class Register:
         Raises:
             ValueError: If field doesn't exist or is write-only
         """
-        if field_name not in self._fields:
+        field = self._fields.get(field_name)
+        if field is None:
             raise ValueError(f"Register '{self.name}' has no field named '{field_name}'")
 
-        field = self._fields[field_name]
         if field.access == "wo":
             raise ValueError(f"Field '{field_name}' in register '{self.name}' is write-only")
 
-        reg_value = await self.read_async()
+        if field.access == "rw" and self._shadow is not None:
+            reg_value = self._shadow
+        else:
+            reg_value = await self.read_async()
         return field.extract_value(reg_value)
 
     async def write_field_async(self, field_name: str, value: int) -> None:
@@ -480,10 +614,10 @@ class Register:
         Raises:
             ValueError: If field doesn't exist, is read-only, or value is out of range
         """
-        if field_name not in self._fields:
+        field = self._fields.get(field_name)
+        if field is None:
             raise ValueError(f"Register '{self.name}' has no field named '{field_name}'")
 
-        field = self._fields[field_name]
         if field.access == "ro":
             raise ValueError(f"Field '{field_name}' in register '{self.name}' is read-only")
 
@@ -494,11 +628,11 @@ class Register:
 
         if field.access == "rw":
             # Read-modify-write for read-write fields
-            reg_value = await self.read_async()
+            reg_value = self._shadow if self._shadow is not None else await self.read_async()
             new_reg_value = field.insert_value(reg_value, value)
         elif field.access == "rw1c":
             # Read-write-1-to-clear
-            reg_value = await self.read_async()
+            reg_value = self._shadow if self._shadow is not None else await self.read_async()
             clear_mask = (value << field.offset) & field.mask
             new_reg_value = reg_value & ~clear_mask
         else:
@@ -521,79 +655,78 @@ class Register:
         if name.startswith("_"):
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-        if name not in self._fields:
+        field = self._fields.get(name)
+        if field is None:
             raise AttributeError(f"Register '{self.name}' has no field named '{name}'")
 
-        field = self._fields[name]
-
-        # Create a property-like object for this field
-        class FieldProperty:
-            def __init__(self, register, field):
-                self._register = register
-                self._field = field
-
-            def read(self):
-                if self._field.access == "wo":
-                    raise ValueError(f"Field '{self._field.name}' is write-only")
-                reg_value = self._register.read()
-                mask = ((1 << self._field.width) - 1) << self._field.offset
-                return (reg_value & mask) >> self._field.offset
-
-            def write(self, value):
-                if self._field.access == "ro":
-                    raise ValueError(f"Field '{self._field.name}' is read-only")
-
-                if value > ((1 << self._field.width) - 1):
-                    raise ValueError(f"Value {value} exceeds field width {self._field.width}")
-
-                if self._field.access == "rw":
-                    reg_value = self._register.read()
-                    mask = ((1 << self._field.width) - 1) << self._field.offset
-                    cleared_val = reg_value & ~mask
-                    new_reg_value = cleared_val | ((value << self._field.offset) & mask)
-                elif self._field.access == "rw1c":
-                    # Read-write-1-to-clear: writing 1 clears the bit, writing 0 has no effect
-                    reg_value = self._register.read()
-                    clear_mask = (value << self._field.offset) & (
-                        (1 << self._field.width) - 1
-                    ) << self._field.offset
-                    new_reg_value = reg_value & ~clear_mask
-                else:
-                    # Write-only field
-                    reg_value = 0
-                    mask = ((1 << self._field.width) - 1) << self._field.offset
-                    cleared_val = reg_value & ~mask
-                    new_reg_value = cleared_val | ((value << self._field.offset) & mask)
-                self._register.write(new_reg_value)
-
-            def __int__(self):
-                return self.read()
-
-            def __index__(self):
-                return self.read()
-
-            def __format__(self, format_spec):
-                return format(self.read(), format_spec)
-
-            def __str__(self):
-                return str(self.read())
-
-            def __repr__(self):
-                return repr(self.read())
-
-        return FieldProperty(self, field)
+        return _FieldProperty(self, field)
 
     def __setattr__(self, name: str, value):
         """Dynamic field access for writing field values."""
-        if name.startswith("_") or name in ["name", "offset", "description"]:
+        if name[:1] == "_" or name in _REGISTER_ATTRS:
             super().__setattr__(name, value)
-        elif hasattr(self, "_fields") and name in self._fields:
-            field_prop = getattr(self, name)
-            field_prop.write(value)
+            return
+        field = self.__dict__.get("_fields", {}).get(name)
+        if field is not None:
+            _FieldProperty(self, field).write(value)
         else:
             super().__setattr__(name, value)
 
 
+class _FieldProperty:
+    """
+    Property-like view of one bit field, returned by `Register.__getattr__`.
+
+    Defined at module level so that a field access does not have to build a
+    new class object each time.
+    """
+
+    __slots__ = ("_register", "_field")
+
+    def __init__(self, register, field):
+        self._register = register
+        self._field = field
+
+    def read(self):
+        if self._field.access == "wo":
+            raise ValueError(f"Field '{self._field.name}' is write-only")
+        return self._field.extract_value(self._register._field_read_value(self._field))
+
+    def write(self, value):
+        field = self._field
+        if field.access == "ro":
+            raise ValueError(f"Field '{field.name}' is read-only")
+
+        if value > ((1 << field.width) - 1):
+            raise ValueError(f"Value {value} exceeds field width {field.width}")
+
+        if field.access == "rw":
+            new_reg_value = field.insert_value(self._register._current_value(), value)
+        elif field.access == "rw1c":
+            # Read-write-1-to-clear: writing 1 clears the bit, writing 0 has no effect
+            reg_value = self._register._current_value()
+            new_reg_value = reg_value & ~((value << field.offset) & field.mask)
+        else:
+            # Write-only field
+            new_reg_value = field.insert_value(0, value)
+        self._register.write(new_reg_value)
+
+    def __int__(self):
+        return self.read()
+
+    def __index__(self):
+        return self.read()
+
+    def __format__(self, format_spec):
+        return format(self.read(), format_spec)
+
+    def __str__(self):
+        return str(self.read())
+
+    def __repr__(self):
+        return repr(self.read())
+
+
 class RegisterArrayAccessor:
     """
     Provides indexed access to a block of registers (Block RAM regions).
@@ -671,6 +804,48 @@ class RegisterArrayAccessor:
         """Get the number of elements in the array."""
         return self._count
 
+    def read_all(self) -> List[int]:
+        """
+        Read the raw value of every element in the array.
+
+        Packed arrays (4-byte stride) are fetched with a single `read_words`
+        call, so backends with burst support read the whole array in one
+        transaction. Other strides fall back to one read per element, which
+        avoids touching the gaps between elements.
+
+        Returns:
+            List of element values, in index order
+        """
+        if self._stride == 4:
+            return self._bus.read_words(self._base_offset, self._count)
+        return [
+            self._bus.read_word(self._base_offset + index * self._stride)
+            for index in range(self._count)
+        ]
+
+    async def read_all_async(self) -> List[int]:
+        """
+        Async version of `read_all` for cocotb compatibility.
+
+        Returns:
+            List of element values, in index order
+        """
+        if self._stride == 4:
+            result = self._bus.read_words(self._base_offset, self._count)
+            if hasattr(result, "__await__"):
+                result = await result
+            # An async backend that only implements read_word inherits the
+            # synchronous read_words fallback, which yields one coroutine per word
+            return [await value if hasattr(value, "__await__") else value for value in result]
+
+        values = []
+        for index in range(self._count):
+            result = self._bus.read_word(self._base_offset + index * self._stride)
+            if hasattr(result, "__await__"):
+                result = await result
+            values.append(result)
+        return values
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get information about this register array.
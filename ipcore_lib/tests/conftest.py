@@ -8,3 +8,28 @@ import pytest
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
+
+from ipcore_lib.runtime.register import AbstractBusInterface  # noqa: E402
+
+
+class CountingBusInterface(AbstractBusInterface):
+    """Dict-backed mock bus interface that counts scalar reads and writes."""
+
+    def __init__(self):
+        self.memory = {}
+        self.reads = 0
+        self.writes = 0
+
+    def read_word(self, address: int) -> int:
+        self.reads += 1
+        return self.memory.get(address, 0)
+
+    def write_word(self, address: int, data: int) -> None:
+        self.writes += 1
+        self.memory[address] = data & 0xFFFFFFFF
+
+
+@pytest.fixture
+def counting_bus():
+    """Fresh CountingBusInterface with empty memory and zeroed counters."""
+    return CountingBusInterface()
@@ -0,0 +1,119 @@
+"""
+Test module for the bulk word transfer API of AbstractBusInterface.
+"""
+
+import asyncio
+import warnings
+
+import pytest
+
+from ipcore_lib.runtime.register import AbstractBusInterface, BitField, RegisterArrayAccessor
+
+
+class TestBulkTransfers:
+    """Test cases for read_words/write_words default implementations."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, counting_bus):
+        """Set up test fixtures."""
+        self.bus = counting_bus
+
+    def test_write_words_consecutive_addresses(self):
+        """Test that write_words places values at 4-byte strides."""
+        self.bus.write_words(0x100, [1, 2, 3])
+
+        assert self.bus.memory == {0x100: 1, 0x104: 2, 0x108: 3}
+        assert self.bus.writes == 3
+
+    def test_read_words_consecutive_addresses(self):
+        """Test that read_words returns values in ascending address order."""
+        self.bus.memory.update({0x20: 0xA, 0x24: 0xB, 0x28: 0xC})
+
+        assert self.bus.read_words(0x20, 3) == [0xA, 0xB, 0xC]
+        assert self.bus.reads == 3
+
+    def test_empty_transfers(self):
+        """Test that zero-length transfers issue no bus transactions."""
+        assert self.bus.read_words(0x0, 0) == []
+        self.bus.write_words(0x0, [])
+
+        assert self.bus.reads == 0
+        assert self.bus.writes == 0
+
+
+class AsyncMockBusInterface(AbstractBusInterface):
+    """Async mock bus interface that only implements the scalar transfers."""
+
+    def __init__(self):
+        self.memory = {}
+
+    async def read_word(self, address: int) -> int:
+        return self.memory.get(address, 0)
+
+    async def write_word(self, address: int, data: int) -> None:
+        self.memory[address] = data & 0xFFFFFFFF
+
+
+class TestRegisterArrayReadAll:
+    """Test cases for RegisterArrayAccessor.read_all."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, counting_bus):
+        """Set up test fixtures."""
+        self.bus = counting_bus
+        self.bulk_reads = []
+        read_words = self.bus.read_words
+
+        def recording_read_words(address, count):
+            self.bulk_reads.append((address, count))
+            return read_words(address, count)
+
+        self.bus.read_words = recording_read_words
+        for i in range(4):
+            self.bus.memory[0x200 + 4 * i] = i + 10
+            self.bus.memory[0x300 + 8 * i] = i + 20
+
+    def make_array(self, base: int, stride: int) -> RegisterArrayAccessor:
+        return RegisterArrayAccessor(
+            name="LUT",
+            base_offset=base,
+            count=4,
+            stride=stride,
+            field_template=[BitField(name="value", offset=0, width=32)],
+            bus_interface=self.bus,
+        )
+
+    def test_packed_array_uses_one_bulk_read(self):
+        """Test that a 4-byte stride array is read with read_words."""
+        assert self.make_array(0x200, 4).read_all() == [10, 11, 12, 13]
+        assert self.bulk_reads == [(0x200, 4)]
+
+    def test_strided_array_reads_each_element(self):
+        """Test that gaps between elements are not read."""
+        assert self.make_array(0x300, 8).read_all() == [20, 21, 22, 23]
+        assert self.bulk_reads == []
+        assert self.bus.reads == 4
+
+    def test_read_all_async(self):
+        """Test the async variant with a synchronous backend."""
+        values = asyncio.run(self.make_array(0x200, 4).read_all_async())
+        assert values == [10, 11, 12, 13]
+
+    def test_read_all_async_scalar_only_async_backend(self):
+        """Test that words from the inherited read_words fallback are awaited."""
+        bus = AsyncMockBusInterface()
+        bus.memory.update({0x200: 1, 0x204: 2, 0x208: 3, 0x20C: 4})
+        array = RegisterArrayAccessor(
+            name="LUT",
+            base_offset=0x200,
+            count=4,
+            stride=4,
+            field_template=[BitField(name="value", offset=0, width=32)],
+            bus_interface=bus,
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            values = asyncio.run(array.read_all_async())
+
+        assert values == [1, 2, 3, 4]
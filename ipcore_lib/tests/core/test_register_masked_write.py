@@ -0,0 +1,46 @@
+"""
+Test module for Register.write_masked.
+"""
+
+import pytest
+
+from ipcore_lib.runtime.register import BitField, Register
+
+
+class TestWriteMasked:
+    """Test cases for mask-based register updates."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, counting_bus):
+        """Set up test fixtures."""
+        self.bus = counting_bus
+        self.reg = Register(
+            name="gpio_out",
+            offset=0x4,
+            bus=self.bus,
+            fields=[BitField(name="pins", offset=0, width=32, access="rw")],
+        )
+
+    def test_preserves_unmasked_bits(self):
+        """Test that only masked bits change."""
+        self.bus.memory[0x4] = 0xF0F0
+        self.reg.write_masked(0x00FF, 0x1234)
+
+        assert self.bus.memory[0x4] == 0xF034
+        assert self.bus.reads == 1
+
+    def test_full_mask_skips_read(self):
+        """Test that a full-width mask is a plain write."""
+        self.reg.write_masked(0xFFFFFFFF, 0xA5A5A5A5)
+
+        assert self.bus.memory[0x4] == 0xA5A5A5A5
+        assert self.bus.reads == 0
+
+    def test_uses_shadow(self):
+        """Test that a shadowed register does not read the bus."""
+        reg = Register("ctrl", 0x8, self.bus, [BitField("bits", 0, 8)], shadow=True)
+        reg.write(0x0F)
+        reg.write_masked(0x30, 0xFF)
+
+        assert self.bus.memory[0x8] == 0x3F
+        assert self.bus.reads == 0
@@ -0,0 +1,148 @@
+"""
+Test module for the Register write-through shadow.
+
+A shadowed register remembers the last value it wrote or read and uses it as
+the base of field read-modify-writes, so only the write reaches the bus.
+"""
+
+import asyncio
+
+import pytest
+
+from ipcore_lib.runtime.register import BitField, Register
+
+
+class TestRegisterShadow:
+    """Test cases for the shadowed read-modify-write path."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, counting_bus):
+        """Set up test fixtures."""
+        self.bus = counting_bus
+        self.fields = [
+            BitField(name="enable", offset=0, width=1, access="rw"),
+            BitField(name="mode", offset=4, width=3, access="rw"),
+        ]
+
+    def make_register(self, shadow: bool) -> Register:
+        return Register(name="ctrl", offset=0x8, bus=self.bus, fields=self.fields, shadow=shadow)
+
+    def test_disabled_by_default(self):
+        """Test that an unshadowed register reads before every field write."""
+        reg = self.make_register(shadow=False)
+        reg.write_field("enable", 1)
+        reg.write_field("mode", 5)
+
+        assert self.bus.reads == 2
+        assert self.bus.memory[0x8] == 0x51
+
+    def test_field_writes_skip_bus_read(self):
+        """Test that only the first read-modify-write reads the bus."""
+        reg = self.make_register(shadow=True)
+        reg.write_field("enable", 1)
+        reg.write_field("mode", 5)
+        reg.mode = 3
+        reg.write_multiple_fields({"enable": 0, "mode": 1})
+
+        assert self.bus.reads == 1
+        assert self.bus.writes == 4
+        assert self.bus.memory[0x8] == 0x10
+
+    def test_full_write_primes_shadow(self):
+        """Test that a register-level write is reused as the next base."""
+        reg = self.make_register(shadow=True)
+        reg.write(0x30)
+        reg.write_field("enable", 1)
+
+        assert self.bus.reads == 0
+        assert self.bus.memory[0x8] == 0x31
+
+    def test_invalidate_forces_read(self):
+        """Test that external changes are picked up after invalidation."""
+        reg = self.make_register(shadow=True)
+        reg.write(0x0)
+        self.bus.memory[0x8] = 0x70
+        reg.invalidate_shadow()
+        reg.write_field("enable", 1)
+
+        assert self.bus.reads == 1
+        assert self.bus.memory[0x8] == 0x71
+
+    def test_async_field_writes_use_shadow(self):
+        """Test that the async read-modify-write path shares the shadow."""
+        reg = self.make_register(shadow=True)
+
+        async def run():
+            await reg.write_async(0x20)
+            await reg.write_field_async("enable", 1)
+
+        asyncio.run(run())
+        assert self.bus.reads == 0
+        assert self.bus.memory[0x8] == 0x21
+
+    def test_field_reads_use_shadow(self):
+        """Test that field reads are served from the shadow but read() is not."""
+        reg = self.make_register(shadow=True)
+        reg.write(0x51)
+
+        assert reg.read_field("mode") == 5
+        assert int(reg.enable) == 1
+        assert reg.read_all_fields() == {"enable": 1, "mode": 5}
+        assert self.bus.reads == 0
+
+        self.bus.memory[0x8] = 0x30
+        assert reg.read() == 0x30
+        assert reg.read_field("mode") == 3
+        assert self.bus.reads == 1
+
+    def test_write_only_bits_not_replayed(self):
+        """Test that a strobe bit is not written again by the next field write."""
+        self.fields = [
+            BitField(name="start", offset=0, width=1, access="wo"),
+            BitField(name="mode", offset=4, width=3, access="rw"),
+        ]
+        reg = self.make_register(shadow=True)
+        written = []
+        self.bus.write_word = lambda address, data: written.append(data)
+
+        reg.start = 1
+        reg.mode = 2
+
+        assert written == [0x1, 0x20]
+
+    def test_clear_bits_not_replayed(self):
+        """Test that a write-1-to-clear bit read back is not written back."""
+        self.fields = [
+            BitField(name="irq", offset=0, width=1, access="rw1c"),
+            BitField(name="mode", offset=4, width=3, access="rw"),
+        ]
+        reg = self.make_register(shadow=True)
+        self.bus.memory[0x8] = 0x31
+
+        assert reg.read() == 0x31
+        reg.write_field("mode", 2)
+
+        assert self.bus.memory[0x8] == 0x20
+
+    def test_read_only_fields_rejected(self):
+        """Test that a register with hardware-owned fields cannot be shadowed."""
+        self.fields.append(BitField(name="busy", offset=8, width=1, access="ro"))
+
+        with pytest.raises(ValueError, match="field 'busy' is read-only"):
+            self.make_register(shadow=True)
+        assert self.make_register(shadow=False).get_fields() == ["enable", "mode", "busy"]
+
+    def test_clear_flags_read_from_bus(self):
+        """Test that hardware-set flags are read from the bus, not the shadow."""
+        self.fields.append(BitField(name="done", offset=8, width=1, access="rw1c"))
+        reg = self.make_register(shadow=True)
+        reg.write(0x51)
+        self.bus.memory[0x8] = 0x151
+
+        assert reg.read_field("mode") == 5
+        assert self.bus.reads == 0
+        assert reg.read_field("done") == 1
+        assert int(reg.done) == 1
+        assert asyncio.run(reg.read_field_async("done")) == 1
+        assert reg.read_all_fields() == {"enable": 1, "mode": 5, "done": 1}
+        assert self.bus.reads == 4
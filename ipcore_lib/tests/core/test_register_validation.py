@@ -0,0 +1,56 @@
+"""
+Test module for Register field validation.
+"""
+
+import pytest
+
+from ipcore_lib.runtime.register import AbstractBusInterface, BitField, Register
+
+
+class NullBusInterface(AbstractBusInterface):
+    """Mock bus interface that is never accessed."""
+
+    def read_word(self, address: int) -> int:
+        return 0
+
+    def write_word(self, address: int, data: int) -> None:
+        pass
+
+
+class TestFieldOverlap:
+    """Test cases for bit overlap detection."""
+
+    def test_adjacent_fields_accepted(self):
+        """Test that fields sharing no bits are accepted."""
+        reg = Register(
+            "CTRL",
+            0x0,
+            NullBusInterface(),
+            [BitField("LOW", 0, 4), BitField("HIGH", 4, 28)],
+        )
+        assert reg.get_fields() == ["LOW", "HIGH"]
+
+    def test_overlap_reports_lowest_clashing_bit(self):
+        """Test that the error names the first bit claimed twice."""
+        with pytest.raises(ValueError, match="Bit overlap in register 'CTRL' at bit 8$"):
+            Register(
+                "CTRL",
+                0x0,
+                NullBusInterface(),
+                [BitField("A", 0, 4), BitField("B", 8, 4), BitField("C", 6, 4)],
+            )
+
+
+class TestRegisterAttributes:
+    """Test cases for attribute assignment on Register."""
+
+    def test_non_field_attributes_set_normally(self):
+        """Test that names which are not fields, even an empty one, are plain attributes."""
+        reg = Register("CTRL", 0x0, NullBusInterface(), [BitField("EN", 0, 1)])
+        setattr(reg, "", 1)
+        reg.tag = "x"
+        reg.name = "CTRL2"
+
+        assert getattr(reg, "") == 1
+        assert reg.tag == "x"
+        assert reg.name == "CTRL2"
@@ -0,0 +1,97 @@
+"""
+Test module for the BurstingBus write-combining wrapper.
+"""
+
+from ipcore_lib.driver.bus import BurstingBus
+from ipcore_lib.runtime.register import AbstractBusInterface, BitField, Register
+
+
+class RecordingBusInterface(AbstractBusInterface):
+    """Mock backend that records every transaction it receives."""
+
+    def __init__(self):
+        self.memory = {}
+        self.transactions = []
+
+    def read_word(self, address: int) -> int:
+        self.transactions.append(("read", address))
+        return self.memory.get(address, 0)
+
+    def write_word(self, address: int, data: int) -> None:
+        self.transactions.append(("write", address, data))
+        self.memory[address] = data
+
+    def write_words(self, address: int, values) -> None:
+        self.transactions.append(("write_words", address, list(values)))
+        for i, value in enumerate(values):
+            self.memory[address + 4 * i] = value
+
+
+class TestBurstingBus:
+    """Test cases for write coalescing and flush rules."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.backend = RecordingBusInterface()
+        self.bus = BurstingBus(self.backend, burst=8)
+
+    def test_writes_are_queued_until_flush(self):
+        """Test that writes are not forwarded before a flush."""
+        self.bus.write_word(0x0, 1)
+        assert self.backend.transactions == []
+
+        self.bus.flush()
+        assert self.backend.transactions == [("write", 0x0, 1)]
+
+    def test_adjacent_writes_coalesce_into_one_burst(self):
+        """Test that ascending adjacent writes become a single write_words."""
+        for i in range(4):
+            self.bus.write_word(0x100 + 4 * i, i)
+        self.bus.flush()
+
+        assert self.backend.transactions == [("write_words", 0x100, [0, 1, 2, 3])]
+
+    def test_issue_order_is_preserved(self):
+        """Test that non-adjacent writes are not reordered by address."""
+        self.bus.write_word(0x8, 0xA)
+        self.bus.write_word(0x0, 0xB)
+        self.bus.write_word(0x4, 0xC)
+        self.bus.flush()
+
+        assert self.backend.transactions == [
+            ("write", 0x8, 0xA),
+            ("write_words", 0x0, [0xB, 0xC]),
+        ]
+
+    def test_read_flushes_pending_writes(self):
+        """Test that a read observes previously queued writes."""
+        self.bus.write_word(0x10, 0x55)
+
+        assert self.bus.read_word(0x10) == 0x55
+        assert self.backend.transactions == [("write", 0x10, 0x55), ("read", 0x10)]
+
+    def test_queue_flushes_at_burst_size(self):
+        """Test the automatic flush once `burst` words are queued."""
+        self.bus.write_words(0x0, list(range(8)))
+
+        assert self.backend.transactions == [("write_words", 0x0, list(range(8)))]
+
+    def test_context_manager_flushes_on_exit(self):
+        """Test that leaving a with block flushes the queue."""
+        with BurstingBus(self.backend) as bus:
+            bus.write_word(0x0, 7)
+        assert self.backend.memory[0x0] == 7
+
+    def test_register_read_modify_write(self):
+        """Test that Register RMW through the wrapper sees its own writes."""
+        reg = Register(
+            name="ctrl",
+            offset=0x20,
+            bus=self.bus,
+            fields=[BitField("a", 0, 4), BitField("b", 4, 4)],
+        )
+        reg.write_field("a", 3)
+        reg.write_field("b", 5)
+        self.bus.flush()
+
+        assert self.backend.memory[0x20] == 0x53
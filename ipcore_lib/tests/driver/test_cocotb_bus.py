@@ -0,0 +1,106 @@
+"""
+Test module for CocotbBus backend selection and bulk transfers.
+"""
+
+import asyncio
+
+import pytest
+
+from ipcore_lib.driver import bus as bus_module
+from ipcore_lib.driver.bus import CocotbBus
+
+
+class FakeDut:
+    """Stand-in DUT exposing only a reset signal."""
+
+    rst = object()
+
+
+class ReadResult:
+    """Stand-in for cocotbext-axi's read result."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class FakeAxiLiteMaster:
+    """Byte-addressed stand-in for AxiLiteMaster that records transactions."""
+
+    def __init__(self):
+        self.memory = bytearray(64)
+        self.transactions = []
+
+    async def read(self, address, length):
+        self.transactions.append(("read", address, length))
+        return ReadResult(bytes(self.memory[address : address + length]))
+
+    async def write(self, address, data):
+        self.transactions.append(("write", address, len(data)))
+        self.memory[address : address + len(data)] = data
+
+
+class TestCocotbBusBackends:
+    """Test cases for the bus_type dispatch table."""
+
+    def test_unsupported_bus_type(self):
+        """Test that an unknown bus_type is rejected."""
+        with pytest.raises(ValueError, match="Unsupported bus_type"):
+            CocotbBus(FakeDut(), "s_axi", clock=None, bus_type="wishbone")
+
+    def test_handlers_bound_from_table(self, monkeypatch):
+        """Test that the driver factory and handlers come from the table entry."""
+        created = []
+
+        def make_driver(dut, bus_name, clock, reset):
+            created.append((bus_name, reset))
+            return "driver"
+
+        monkeypatch.setitem(
+            bus_module._BUS_BACKENDS,
+            "avmm",
+            (make_driver, "_read_avmm", "_write_avmm", "_read_words_scalar", "_write_words_scalar"),
+        )
+        bus = CocotbBus(FakeDut(), "s_avmm", clock=None, bus_type="avmm")
+
+        assert created == [("s_avmm", FakeDut.rst)]
+        assert bus._driver == "driver"
+        assert bus._read == bus._read_avmm
+        assert bus._write == bus._write_avmm
+        assert bus._read_words == bus._read_words_scalar
+        assert bus._write_words == bus._write_words_scalar
+
+
+class TestCocotbBusBulkTransfers:
+    """Test cases for the AXI-Lite burst read_words/write_words."""
+
+    @pytest.fixture
+    def axil_bus(self, monkeypatch):
+        master = FakeAxiLiteMaster()
+        entry = bus_module._BUS_BACKENDS["axil"]
+        monkeypatch.setitem(bus_module._BUS_BACKENDS, "axil", (lambda *args: master,) + entry[1:])
+        return CocotbBus(FakeDut(), "s_axi", clock=None)
+
+    def test_write_words_packs_little_endian(self, axil_bus):
+        """Test that a burst write is one transaction of little-endian words."""
+        asyncio.run(axil_bus.write_words(0x8, [0x11223344, 0xAABBCCDD]))
+
+        master = axil_bus._driver
+        assert master.transactions == [("write", 0x8, 8)]
+        assert bytes(master.memory[0x8:0x10]) == bytes.fromhex("44332211ddccbbaa")
+
+    def test_read_words_unpacks_little_endian(self, axil_bus):
+        """Test that a burst read is one transaction split back into words."""
+        master = axil_bus._driver
+        master.memory[0x10:0x18] = bytes.fromhex("78563412efbeadde")
+
+        values = asyncio.run(axil_bus.read_words(0x10, 2))
+
+        assert values == [0x12345678, 0xDEADBEEF]
+        assert master.transactions == [("read", 0x10, 8)]
+
+    def test_empty_transfers_skip_bus(self, axil_bus):
+        """Test that zero-length transfers issue no transaction."""
+        assert asyncio.run(axil_bus.read_words(0x0, 0)) == []
+        asyncio.run(axil_bus.write_words(0x0, []))
+
+        assert axil_bus._driver.transactions == []
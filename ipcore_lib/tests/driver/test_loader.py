@@ -0,0 +1,190 @@
+"""
+Test module for the YAML memory map loader.
+"""
+
+import os
+
+import pytest
+import yaml
+
+from ipcore_lib.driver import loader
+from ipcore_lib.driver.loader import load_driver
+from ipcore_lib.runtime.register import AbstractBusInterface
+
+MEMORY_MAP = """
+- name: CSR_MAP
+  addressBlocks:
+    - name: CSR
+      offset: 0x100
+      registers:
+        - name: CTRL
+          fields:
+            - name: ENABLE
+              bits: "[0:0]"
+              access: read-write
+            - name: MODE
+              bits: "[5:4]"
+        - name: STATUS
+          fields:
+            - name: BUSY
+              bit: 0
+              access: read-only
+"""
+
+
+class MockBusInterface(AbstractBusInterface):
+    """Simple memory-backed bus for loader tests."""
+
+    def __init__(self):
+        self.memory = {}
+
+    def read_word(self, address: int) -> int:
+        return self.memory.get(address, 0)
+
+    def write_word(self, address: int, data: int) -> None:
+        self.memory[address] = data
+
+
+@pytest.fixture
+def map_file(tmp_path):
+    path = tmp_path / "csr_memmap.yml"
+    path.write_text(MEMORY_MAP)
+    return path
+
+
+class TestLoadDriver:
+    """Test cases for load_driver."""
+
+    def test_registers_and_fields(self, map_file):
+        """Test that blocks, registers and fields are built from the map."""
+        bus = MockBusInterface()
+        driver = load_driver(str(map_file), bus)
+
+        assert driver.CSR.CTRL.offset == 0x100
+        assert driver.CSR.STATUS.offset == 0x104
+        driver.CSR.CTRL.MODE = 2
+        assert bus.memory[0x100] == 0x20
+        assert driver.CSR.CTRL.get_field_info("ENABLE").access == "rw"
+        assert driver.CSR.STATUS.get_field_info("BUSY").access == "ro"
+
+    def test_shadow_key(self, tmp_path, counting_bus):
+        """Test that `shadow: true` enables the register shadow."""
+        path = tmp_path / "ctrl_memmap.yml"
+        path.write_text(
+            "addressBlocks:\n"
+            "  - name: CSR\n"
+            "    registers:\n"
+            "      - name: CTRL\n"
+            "        shadow: true\n"
+            "        fields: [{name: ENABLE, bit: 0}, {name: MODE, bits: '[5:4]'}]\n"
+            "      - name: CFG\n"
+            "        fields: [{name: ENABLE, bit: 0}]\n"
+        )
+        driver = load_driver(str(path), counting_bus)
+
+        driver.CSR.CTRL.ENABLE = 1
+        driver.CSR.CTRL.MODE = 2
+        assert counting_bus.reads == 1
+        assert counting_bus.memory[0x0] == 0x21
+
+        driver.CSR.CFG.ENABLE = 1
+        driver.CSR.CFG.ENABLE = 0
+        assert counting_bus.reads == 3
+
+    def test_shadow_key_rejected_on_arrays(self, tmp_path):
+        """Test that register arrays cannot be shadowed."""
+        path = tmp_path / "lut_memmap.yml"
+        path.write_text(
+            "addressBlocks:\n"
+            "  - name: LUT\n"
+            "    registers:\n"
+            "      - name: ENTRY\n"
+            "        count: 4\n"
+            "        shadow: true\n"
+            "        fields: [{name: VALUE, bits: '[31:0]'}]\n"
+        )
+        with pytest.raises(ValueError, match="cannot be shadowed"):
+            load_driver(str(path), MockBusInterface())
+
+    def test_identical_fields_are_shared(self, tmp_path):
+        """Test that registers with the same field spec reuse one BitField."""
+        path = tmp_path / "irq_memmap.yml"
+        path.write_text(
+            "addressBlocks:\n"
+            "  - name: IRQ\n"
+            "    registers:\n"
+            "      - name: IRQ0\n"
+            "        fields: [{name: PENDING, bit: 0, access: rw1c}]\n"
+            "      - name: IRQ1\n"
+            "        fields: [{name: PENDING, bit: 0, access: rw1c}]\n"
+        )
+        driver = load_driver(str(path), MockBusInterface())
+
+        field0 = driver.IRQ.IRQ0.get_field_info("PENDING")
+        assert field0 is driver.IRQ.IRQ1.get_field_info("PENDING")
+        assert field0.access == "rw1c"
+
+    def test_parse_is_cached_per_file_version(self, map_file, monkeypatch):
+        """Test that an unchanged file is parsed once and an edited file again."""
+        calls = []
+        real_load = yaml.load
+
+        def counting_load(stream, Loader):
+            calls.append(stream.name)
+            return real_load(stream, Loader=Loader)
+
+        loader._load_yaml.cache_clear()
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        load_driver(str(map_file), MockBusInterface())
+        load_driver(map_file, MockBusInterface())
+        assert len(calls) == 1
+
+        stat = os.stat(map_file)
+        os.utime(map_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        load_driver(str(map_file), MockBusInterface())
+        assert len(calls) == 2
+
+    def test_import_does_not_load_yaml(self):
+        """Test that importing the driver package leaves PyYAML unimported."""
+        import subprocess
+        import sys
+
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+        code = "import sys, ipcore_lib.driver; print('yaml' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_same_mtime_rewrite_is_reparsed(self, map_file):
+        """Test that a rewrite keeping the old mtime but changing size is picked up."""
+        loader._load_yaml.cache_clear()
+        stat = os.stat(map_file)
+        assert not hasattr(load_driver(str(map_file), MockBusInterface()).CSR, "EXTRA")
+
+        map_file.write_text(MEMORY_MAP + "        - name: EXTRA\n")
+        os.utime(map_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert hasattr(load_driver(str(map_file), MockBusInterface()).CSR, "EXTRA")
+
+
+class TestParseBits:
+    """Test cases for the bit definition parser."""
+
+    @pytest.mark.parametrize(
+        "bits_def, expected",
+        [(3, (3, 1)), ("3", (3, 1)), ("[7:4]", (4, 4)), ("7:4", (4, 4)), (" [0:0] ", (0, 1))],
+    )
+    def test_valid_definitions(self, bits_def, expected):
+        """Test int, single-bit string and range forms."""
+        assert loader._parse_bits(bits_def) == expected
+
+    @pytest.mark.parametrize("bits_def", ["x", [424], None])
+    def test_invalid_definitions(self, bits_def):
+        """Test that unparsable definitions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid bit definition"):
+            loader._parse_bits(bits_def)
@@ -6,13 +6,21 @@ and validates entity parsing, port extraction, generic handling, and
 bus interface detection.
 """
 
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
 from ipcore_lib.model.core import IpCore
 from ipcore_lib.model.port import PortDirection
-from ipcore_lib.parser.hdl.vhdl_ai_parser import ParserConfig, VHDLAiParser
+from ipcore_lib.parser.hdl import vhdl_ai_parser
+from ipcore_lib.parser.hdl.vhdl_ai_parser import (
+    ParserConfig,
+    VHDLAiParser,
+    VhdlLlmParser,
+    _extract_entity_block,
+)
 
 
 @pytest.fixture
@@ -459,6 +467,327 @@ class TestIntegration:
         assert ip_core.vlnv.name == "simple_counter"
 
 
+# ============================================================================
+# Result Cache Tests
+# ============================================================================
+
+
+class StubLlmParser:
+    """Stand-in for VhdlLlmParser that returns a canned entity and counts calls."""
+
+    def __init__(self, batch_error=None, batch_order=None):
+        self.calls = 0
+        self.texts = []
+        self.batch_calls = 0
+        self.batch_error = batch_error
+        self.batch_order = batch_order
+        self.available = True
+
+    def is_available(self):
+        return self.available
+
+    def parse_vhdl_entity(self, vhdl_text):
+        self.calls += 1
+        self.texts.append(vhdl_text)
+        return {
+            "entity_name": vhdl_text.split()[1],
+            "description": "Stub entity",
+            "generics": [{"name": "WIDTH", "type": "integer", "default": "8"}],
+            "bus_interfaces": [],
+        }
+
+    def parse_vhdl_entities(self, vhdl_texts, source_names=None):
+        self.batch_calls += 1
+        if self.batch_error is not None:
+            raise self.batch_error
+        parsed = [self.parse_vhdl_entity(text) for text in vhdl_texts]
+        if self.batch_order is not None:
+            parsed = [parsed[i] for i in self.batch_order]
+        return parsed
+
+
+class TestResultCache:
+    """Test on-disk caching of parse results."""
+
+    def make_parser(self, tmp_path, **kwargs):
+        config = ParserConfig(cache_dir=tmp_path, **kwargs)
+        parser = VHDLAiParser(config=config)
+        parser.llm_parser = StubLlmParser()
+        return parser
+
+    def test_cache_hit_skips_llm(self, tmp_path):
+        """Second parse of identical source is served from the cache."""
+        parser = self.make_parser(tmp_path)
+
+        first = parser.parse_text("entity stub_entity is end;", source_name="stub.vhd")
+        second = parser.parse_text("entity stub_entity is end;", source_name="stub.vhd")
+
+        assert parser.llm_parser.calls == 1
+        assert second == first
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_cache_keyed_on_source_and_model(self, tmp_path):
+        """Changing the source text or the model is a cache miss."""
+        parser = self.make_parser(tmp_path)
+        parser.parse_text("entity a is end;")
+        parser.parse_text("entity b is end;")
+        assert parser.llm_parser.calls == 2
+
+        other_model = self.make_parser(tmp_path, llm_model="other-model")
+        other_model.parse_text("entity a is end;")
+        assert other_model.llm_parser.calls == 1
+
+    @pytest.mark.parametrize(
+        "name, value", [("_CACHE_FORMAT_VERSION", "next"), ("_ENTITY_SYSTEM_PROMPT", "new prompt")]
+    )
+    def test_cache_keyed_on_prompt_and_format(self, tmp_path, monkeypatch, name, value):
+        """Changing the system prompt or the cache format version is a cache miss."""
+        parser = self.make_parser(tmp_path)
+        parser.parse_text("entity a is end;")
+
+        monkeypatch.setattr(vhdl_ai_parser, name, value)
+        parser.parse_text("entity a is end;")
+
+        assert parser.llm_parser.calls == 2
+
+    def test_cache_hit_without_llm(self, tmp_path):
+        """Cached sources are still parsed when the LLM goes offline."""
+        parser = self.make_parser(tmp_path)
+        sources = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.vhd"
+            path.write_text(f"entity {name} is end;")
+            sources.append(path)
+        parser.parse_files(sources)
+        parser.llm_parser.available = False
+
+        assert parser.parse_text("entity a is end;").vlnv.name == "a"
+        assert [core.vlnv.name for core in parser.parse_files(sources)] == ["a", "b"]
+        uncached = parser.parse_text("entity c is end;", source_name="c.vhd")
+        assert uncached.description == "Failed to parse: c.vhd"
+        assert parser.llm_parser.calls == 2
+
+    def test_corrupt_cache_entry_is_ignored(self, tmp_path):
+        """An unreadable cache file falls back to a fresh LLM parse."""
+        parser = self.make_parser(tmp_path)
+        parser.parse_text("entity a is end;")
+        for cache_file in tmp_path.glob("*.json"):
+            cache_file.write_text("not json")
+
+        ip_core = parser.parse_text("entity a is end;")
+
+        assert parser.llm_parser.calls == 2
+        assert ip_core.vlnv.name == "a"
+
+
+class TestPrefilter:
+    """Test reduction of the VHDL source to entity declarations before the LLM call."""
+
+    VHDL_SOURCE = """library ieee;
+use ieee.std_logic_1164.all;
+
+-- Counter with AXI-Lite control
+entity counter is
+    port (clk : in std_logic; end_flag : out std_logic);
+end entity counter;
+
+architecture rtl of counter is
+begin
+end architecture rtl;
+"""
+
+    def test_only_entity_sent_to_llm(self):
+        """The architecture body is stripped, the entity and its header comment are kept."""
+        parser = VHDLAiParser(config=ParserConfig())
+        parser.llm_parser = StubLlmParser()
+
+        parser.parse_text(self.VHDL_SOURCE)
+
+        sent = parser.llm_parser.texts[0]
+        assert sent.startswith("-- Counter with AXI-Lite control")
+        assert sent.rstrip().endswith("end entity counter;")
+        assert "architecture" not in sent
+
+    def test_prefilter_disabled(self):
+        """With prefilter off the full source is sent."""
+        parser = VHDLAiParser(config=ParserConfig(prefilter=False))
+        parser.llm_parser = StubLlmParser()
+
+        parser.parse_text(self.VHDL_SOURCE)
+
+        assert parser.llm_parser.texts[0] == self.VHDL_SOURCE
+
+    def test_long_comment_run_is_linear(self):
+        """A long comment block not followed by an entity does not slow the scan down."""
+        source = "-- license text\n" * 20000 + "package p is end;\n"
+
+        start = time.perf_counter()
+        assert _extract_entity_block(source) == source
+        assert time.perf_counter() - start < 1.0
+
+        header = "-- a\n-- b\n"
+        assert _extract_entity_block(source + header + "entity e is end;") == (
+            header + "entity e is end;"
+        )
+
+    def test_end_inside_comment_does_not_cut_block(self):
+        """An "end;" in a trailing port comment does not end the entity early."""
+        source = """entity pkt is
+    port (
+        last : in std_logic; -- marks packet end;
+        dout : out std_logic_vector(7 downto 0)
+    );
+end entity pkt;
+
+architecture rtl of pkt is
+begin
+end architecture rtl;
+"""
+        block = _extract_entity_block(source)
+
+        assert "dout" in block
+        assert block.endswith("end entity pkt;")
+        assert "architecture" not in block
+
+    def test_no_entity_falls_back_to_full_source(self):
+        """Sources without an entity declaration are sent unchanged."""
+        parser = VHDLAiParser(config=ParserConfig())
+        parser.llm_parser = StubLlmParser()
+
+        parser.parse_text("entity_like_name is not a declaration")
+
+        assert parser.llm_parser.texts[0] == "entity_like_name is not a declaration"
+
+
+class StubProvider:
+    """Stand-in for an llm_core provider that counts client creations."""
+
+    def __init__(self, response='{"entity_name": "stub_entity", "ports": [], "generics": []}'):
+        self.clients_created = 0
+        self.response = response
+
+    def get_client(self):
+        self.clients_created += 1
+        return object()
+
+    def summarize(self, client, user_prompt, system_prompt, context):
+        return self.response
+
+
+class TestClientReuse:
+    """Test that the provider client is shared across parse calls."""
+
+    def test_client_created_once(self):
+        """Repeated parses reuse one provider client (and its connection pool)."""
+        llm_parser = VhdlLlmParser(provider_name="ollama")
+        llm_parser.provider = StubProvider()
+
+        llm_parser.parse_vhdl_entity("entity a is end;")
+        llm_parser.parse_vhdl_entity("entity b is end;")
+
+        assert llm_parser.provider.clients_created == 1
+
+    def test_client_created_once_across_threads(self):
+        """Concurrent first calls still create a single client."""
+        llm_parser = VhdlLlmParser(provider_name="ollama")
+        provider = StubProvider()
+        barrier = threading.Barrier(4)
+        get_client = provider.get_client
+
+        def slow_get_client():
+            time.sleep(0.05)
+            return get_client()
+
+        provider.get_client = slow_get_client
+        llm_parser.provider = provider
+
+        def parse(name):
+            barrier.wait()
+            llm_parser.parse_vhdl_entity(f"entity {name} is end;")
+
+        threads = [threading.Thread(target=parse, args=(f"e{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert provider.clients_created == 1
+
+
+class TestBatchParsing:
+    """Test marshaling several files into one LLM request."""
+
+    @pytest.fixture
+    def vhdl_files(self, tmp_path):
+        paths = []
+        for name in ("alpha", "beta", "gamma"):
+            path = tmp_path / f"{name}.vhd"
+            path.write_text(f"entity {name} is end;")
+            paths.append(path)
+        return paths
+
+    def test_batches_by_batch_size(self, vhdl_files):
+        """Files are grouped into batch_size-sized LLM requests, results keep order."""
+        parser = VHDLAiParser(config=ParserConfig(batch_size=2))
+        parser.llm_parser = StubLlmParser()
+
+        ip_cores = parser.parse_files(vhdl_files)
+
+        assert [core.vlnv.name for core in ip_cores] == ["alpha", "beta", "gamma"]
+        # One batched request for alpha+beta, one single request for gamma
+        assert parser.llm_parser.batch_calls == 1
+        assert parser.llm_parser.calls == 3
+
+    def test_batch_failure_falls_back_to_single(self, vhdl_files):
+        """A failed batched request is retried one file at a time."""
+        parser = VHDLAiParser(config=ParserConfig(batch_size=3))
+        parser.llm_parser = StubLlmParser(batch_error=ValueError("wrong entry count"))
+
+        ip_cores = parser.parse_files(vhdl_files)
+
+        assert [core.vlnv.name for core in ip_cores] == ["alpha", "beta", "gamma"]
+        assert parser.llm_parser.batch_calls == 1
+        assert parser.llm_parser.calls == 3
+
+    def test_reordered_batch_entries_reparsed(self, vhdl_files, tmp_path):
+        """Entries returned out of order are re-parsed alone and never cached."""
+        config = ParserConfig(batch_size=3, cache_dir=tmp_path / "cache")
+        parser = VHDLAiParser(config=config)
+        parser.llm_parser = StubLlmParser(batch_order=[1, 0, 2])
+
+        ip_cores = parser.parse_files(vhdl_files)
+
+        assert [core.vlnv.name for core in ip_cores] == ["alpha", "beta", "gamma"]
+        # 3 entries parsed for the batch, then alpha and beta again on their own
+        assert parser.llm_parser.calls == 5
+
+        parser.llm_parser = StubLlmParser()
+        cached = parser.parse_files(vhdl_files)
+        assert [core.vlnv.name for core in cached] == ["alpha", "beta", "gamma"]
+        assert parser.llm_parser.calls == 0
+
+    def test_parallel_workers_keep_order(self, vhdl_files):
+        """Concurrent single-file requests still return results in input order."""
+        parser = VHDLAiParser(config=ParserConfig(max_workers=3))
+        parser.llm_parser = StubLlmParser()
+
+        ip_cores = parser.parse_files(vhdl_files)
+
+        assert [core.vlnv.name for core in ip_cores] == ["alpha", "beta", "gamma"]
+        assert parser.llm_parser.calls == 3
+
+    def test_parse_vhdl_entities_extracts_array(self):
+        """The batched LLM response is unwrapped from a markdown fence."""
+        llm_parser = VhdlLlmParser(provider_name="ollama")
+        llm_parser.provider = StubProvider(
+            response='```json\n[{"entity_name": "a", "ports": []}, {"entity_name": "b"}]\n```'
+        )
+
+        parsed = llm_parser.parse_vhdl_entities(["entity a is end;", "entity b is end;"])
+
+        assert [entity["entity_name"] for entity in parsed] == ["a", "b"]
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
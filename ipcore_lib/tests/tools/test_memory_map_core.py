@@ -0,0 +1,74 @@
+"""
+Test module for the memory map editor's mock bus interface.
+"""
+
+import os
+import sys
+
+import pytest
+
+editor_dir = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../ipcore_tools/python/memory_map_editor")
+)
+if editor_dir not in sys.path:
+    sys.path.insert(0, editor_dir)
+
+from memory_map_core import MockBusInterface  # noqa: E402
+
+
+class TestDenseMockBus:
+    """Test cases for the bytearray-backed (size_bytes) memory."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.bus = MockBusInterface(size_bytes=64)
+
+    def test_scalar_round_trip(self):
+        """Test that single-word writes are read back and truncated to 32 bits."""
+        self.bus.write_word(0x8, 0x1_2345_6789)
+
+        assert self.bus.read_word(0x8) == 0x2345_6789
+        assert self.bus.read_word(0x4) == 0
+
+    def test_bulk_round_trip(self):
+        """Test that bursts and single-word accesses see the same memory."""
+        self.bus.write_words(0x10, [1, 2, 0xFFFF_FFFF])
+
+        assert self.bus.read_words(0xC, 5) == [0, 1, 2, 0xFFFF_FFFF, 0]
+        assert self.bus.read_word(0x14) == 2
+        assert self.bus.read_words(0x3C, 1) == [0]
+
+    def test_unaligned_access_raises(self):
+        """Test that unaligned addresses are rejected rather than rounded down."""
+        for access in (
+            lambda: self.bus.read_word(0x2),
+            lambda: self.bus.write_word(0x5, 1),
+            lambda: self.bus.read_words(0x6, 2),
+            lambda: self.bus.write_words(0x1, [1]),
+        ):
+            with pytest.raises(ValueError, match="Unaligned"):
+                access()
+
+    @pytest.mark.parametrize("size_bytes", [0, -4, 6])
+    def test_invalid_size_rejected(self, size_bytes):
+        """Test that the buffer size must be a positive multiple of 4."""
+        with pytest.raises(ValueError, match="multiple of 4"):
+            MockBusInterface(size_bytes=size_bytes)
+
+    def test_bulk_read_past_end_raises(self):
+        """Test that a burst running off the end fails like a single read."""
+        with pytest.raises(IndexError):
+            self.bus.read_word(64)
+        with pytest.raises(IndexError):
+            self.bus.read_words(60, 4)
+
+    def test_bulk_write_past_end_raises(self):
+        """Test that a burst write running off the end raises IndexError."""
+        with pytest.raises(IndexError):
+            self.bus.write_words(56, [1, 2, 3])
+        assert self.bus.read_words(56, 2) == [0, 0]
+
+    def test_negative_address_raises(self):
+        """Test that negative addresses do not wrap to the end of the buffer."""
+        with pytest.raises(IndexError):
+            self.bus.write_word(-4, 1)
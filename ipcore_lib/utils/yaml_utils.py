@@ -0,0 +1,25 @@
+"""
+YAML helpers shared by the driver loader and the memory map editor.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def safe_loader() -> Any:
+    """
+    Return the fastest available safe YAML loader class.
+
+    That is the libyaml-backed CSafeLoader, several times faster than the
+    pure-Python SafeLoader, which is used instead when PyYAML was built without
+    libyaml. PyYAML is only imported on the first call.
+
+    Returns:
+        Loader class to pass as `yaml.load(stream, Loader=...)`
+    """
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
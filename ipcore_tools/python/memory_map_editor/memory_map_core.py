@@ -5,6 +5,7 @@ Pure Python implementation of memory map data structures and business logic.
 Integrates with ipcore_lib.core register abstractions.
 """
 
+import array as _array
 import yaml
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Union, Tuple
@@ -17,19 +18,68 @@ project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from ipcore_lib.runtime.register import BitField, Register, AbstractBusInterface, RegisterArrayAccessor
+from ipcore_lib.utils.yaml_utils import safe_loader
 
 
 class MockBusInterface(AbstractBusInterface):
-    """Mock bus interface for GUI operations (no actual hardware access)."""
+    """
+    Mock bus interface for GUI operations (no actual hardware access).
+
+    By default memory is a sparse dict, which suits arbitrary (large) register
+    offsets. Passing size_bytes switches to a dense bytearray viewed as 32-bit
+    words: no hashing per access and 4 bytes per word instead of a dict entry.
+    Dense memory only accepts word-aligned addresses inside the buffer.
+    """
 
-    def __init__(self):
-        self._memory = {}
+    __slots__ = ('_memory', '_view')
+
+    def __init__(self, size_bytes: Optional[int] = None):
+        self._memory: Dict[int, int] = {}
+        self._view: Optional[memoryview] = None
+        if size_bytes is not None:
+            if size_bytes <= 0 or size_bytes % 4:
+                raise ValueError(f"size_bytes must be a positive multiple of 4, got {size_bytes}")
+            self._view = memoryview(bytearray(size_bytes)).cast('I')
+
+    def _word_index(self, address: int, count: int = 1) -> int:
+        """Index of the word at address in the dense buffer, checking that count words fit."""
+        if address & 3:
+            raise ValueError(f"Unaligned address 0x{address:X}: dense mock memory is word-addressed")
+        start = address >> 2
+        if start < 0 or start + count > len(self._view):
+            raise IndexError(
+                f"Address range 0x{address:X} (+{count} words) is outside the "
+                f"{4 * len(self._view)}-byte mock memory"
+            )
+        return start
 
     def read_word(self, address: int) -> int:
+        if self._view is not None:
+            return self._view[self._word_index(address)]
         return self._memory.get(address, 0)
 
     def write_word(self, address: int, data: int) -> None:
-        self._memory[address] = data & 0xFFFFFFFF
+        if self._view is not None:
+            self._view[self._word_index(address)] = data & 0xFFFFFFFF
+        else:
+            self._memory[address] = data & 0xFFFFFFFF
+
+    def read_words(self, address: int, count: int) -> List[int]:
+        if self._view is not None:
+            start = self._word_index(address, count)
+            return self._view[start:start + count].tolist()
+        return [self._memory.get(address + 4 * i, 0) for i in range(count)]
+
+    def write_words(self, address: int, values: List[int]) -> None:
+        if self._view is not None:
+            # Slice assignment copies the whole block in C instead of one
+            # interpreted store per word
+            start = self._word_index(address, len(values))
+            self._view[start:start + len(values)] = _array.array('I', (v & 0xFFFFFFFF for v in values))
+            return
+        self._memory.update(
+            zip(range(address, address + 4 * len(values), 4), (v & 0xFFFFFFFF for v in values))
+        )
 
 
 @dataclass
@@ -90,17 +140,20 @@ class MemoryMapProject:
         errors = []
 
         # Check for bit field overlaps
-        used_bits = [False] * 32
+        used_bits = 0
 
         for field_name, field in register._fields.items():
-            for bit_pos in range(field.offset, field.offset + field.width):
-                if bit_pos >= 32:
-                    errors.append(f"Register {register.name}: Field {field_name} extends beyond 32 bits")
-                    break
+            field_bits = ((1 << field.width) - 1) << field.offset
+
+            overlap = used_bits & field_bits & 0xFFFFFFFF
+            while overlap:
+                low_bit = overlap & -overlap
+                errors.append(f"Register {register.name}: Bit {low_bit.bit_length() - 1} used by multiple fields")
+                overlap ^= low_bit
 
-                if used_bits[bit_pos]:
-                    errors.append(f"Register {register.name}: Bit {bit_pos} used by multiple fields")
-                used_bits[bit_pos] = True
+            if field_bits >> 32:
+                errors.append(f"Register {register.name}: Field {field_name} extends beyond 32 bits")
+            used_bits |= field_bits & 0xFFFFFFFF
 
         return errors
 
@@ -220,7 +273,7 @@ def load_from_yaml(file_path: Union[str, Path]) -> MemoryMapProject:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     with open(file_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=safe_loader())
 
     # Detect format: list (new) or dict (legacy)
     if isinstance(data, list):
@@ -24,10 +24,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from ipcore_lib.generator.hdl.vhdl_generator import VHDLGenerator
-from ipcore_lib.generator.yaml.ip_yaml_generator import IpYamlGenerator
-from ipcore_lib.model.bus_library import BusLibrary, get_bus_library
-from ipcore_lib.parser.yaml.ip_yaml_parser import YamlIpCoreParser
+# Subcommand dependencies (jinja2 templates, pydantic models, HDL parsers) are
+# imported inside each cmd_* function so that --help and argument errors stay fast
 
 # Map YAML bus types to generator templates
 BUS_TYPE_MAP = {
@@ -60,6 +58,9 @@ def log(msg: str, use_progress: bool, use_json: bool):
 
 def cmd_generate(args):
     """Generate VHDL files from IP core YAML."""
+    from ipcore_lib.generator.hdl.vhdl_generator import VHDLGenerator
+    from ipcore_lib.parser.yaml.ip_yaml_parser import YamlIpCoreParser
+
     output_base = args.output or os.path.dirname(args.input)
 
     try:
@@ -141,6 +142,8 @@ def cmd_generate(args):
 
 def cmd_parse(args):
     """Parse VHDL file and generate IP core YAML."""
+    from ipcore_lib.generator.yaml.ip_yaml_generator import IpYamlGenerator
+
     vhdl_path = Path(args.input)
 
     if not vhdl_path.exists():
@@ -203,7 +206,7 @@ def cmd_parse(args):
 
 def cmd_list_buses(args):
     """List available bus types from the bus library."""
-    from ipcore_lib.model.bus_library import SUGGESTED_PREFIXES
+    from ipcore_lib.model.bus_library import SUGGESTED_PREFIXES, get_bus_library
 
     try:
         library = get_bus_library()